@@ -0,0 +1,36 @@
+"""
+Behavioral design patterns.
+
+Public classes are available from the package itself, but are imported lazily:
+`import behavioral` loads none of the pattern modules.
+"""
+
+from lazy_exports import lazy_attributes
+
+# Public name -> module of this package that defines it.
+_EXPORTS = {
+    "Command": "command",
+    "SimpleCommand": "command",
+    "ComplexCommand": "command",
+    "Receiver": "command",
+    "Invoker": "command",
+    "ICommand": "command_example",
+    "Pizzeria": "command_example",
+    "AlphabeticalOrderIterator": "iterator",
+    "WordsCollection": "iterator",
+    "PizzaItem": "iterator_example",
+    "PizzaSliceIterator": "iterator_example",
+    "PizzaAggregate": "iterator_example",
+    "Subject": "observer",
+    "ConcreteSubject": "observer",
+    "Observer": "observer",
+    "ConcreteObserverA": "observer",
+    "ConcreteObserverB": "observer",
+    "OverflowPolicy": "observer_mailbox",
+    "Mailbox": "observer_mailbox",
+    "MailboxObserver": "observer_mailbox",
+}
+
+__all__ = sorted(_EXPORTS)
+
+__getattr__, __dir__ = lazy_attributes(__name__, _EXPORTS)
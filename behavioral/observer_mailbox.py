@@ -0,0 +1,220 @@
+"""
+Observer with mailboxes: every subscriber gets its own bounded queue of events,
+drained by its own worker thread, so a slow subscriber can no longer block the
+publisher or make it grow memory without bound.
+"""
+
+from __future__ import annotations
+import copy
+import threading
+import time
+from collections import deque
+from enum import Enum, auto
+from typing import Deque, Dict
+
+from behavioral.observer import ConcreteSubject, Observer, Subject
+
+
+class OverflowPolicy(Enum):
+    """
+    What the mailbox does with an event that arrives when it is already full.
+    """
+    BLOCK = auto()        # the publisher waits until there is free space
+    DROP_OLDEST = auto()  # the oldest queued event is discarded
+    DROP_NEWEST = auto()  # the incoming event is discarded
+    KEEP_LATEST = auto()  # the incoming event overwrites the newest queued one
+
+
+class Mailbox:
+    """
+    A bounded FIFO of events with a configurable overflow policy.
+    Depth and drop counters are available through `metrics()`.
+    """
+
+    def __init__(self, maxsize: int = 64, policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST) -> None:
+        if maxsize < 1:
+            raise ValueError("Mailbox size must be positive")
+        self._maxsize = maxsize
+        self._policy = policy
+        self._queue: Deque = deque()
+        self._not_empty = threading.Condition()
+        self._not_full = threading.Condition(self._not_empty)
+        self._closed = False
+        self._received = 0
+        self._delivered = 0
+        self._dropped = 0
+        self._overwritten = 0
+        self._max_depth = 0
+
+    def put(self, event) -> bool:
+        """
+        Puts an event into the mailbox. Returns False if the event itself was
+        dropped (DROP_NEWEST policy or a closed mailbox).
+        """
+        with self._not_empty:
+            if self._closed:
+                return False
+            self._received += 1
+            if len(self._queue) >= self._maxsize:
+                if self._policy is OverflowPolicy.BLOCK:
+                    while len(self._queue) >= self._maxsize and not self._closed:
+                        self._not_full.wait()
+                    if self._closed:
+                        # Counted as received above, so it must not vanish from the metrics.
+                        self._dropped += 1
+                        return False
+                elif self._policy is OverflowPolicy.DROP_OLDEST:
+                    self._queue.popleft()
+                    self._dropped += 1
+                elif self._policy is OverflowPolicy.DROP_NEWEST:
+                    self._dropped += 1
+                    return False
+                else:
+                    self._queue[-1] = event
+                    self._overwritten += 1
+                    return True
+            self._queue.append(event)
+            if len(self._queue) > self._max_depth:
+                self._max_depth = len(self._queue)
+            self._not_empty.notify()
+            return True
+
+    def get(self, timeout: float = None):
+        """
+        Takes the oldest event. Raises LookupError when the mailbox is closed
+        and empty, or when the timeout expires.
+        """
+        with self._not_empty:
+            if not self._not_empty.wait_for(lambda: self._queue or self._closed, timeout):
+                raise LookupError("Mailbox is empty")
+            if not self._queue:
+                raise LookupError("Mailbox is closed")
+            event = self._queue.popleft()
+            self._delivered += 1
+            self._not_full.notify()
+            return event
+
+    def close(self) -> None:
+        with self._not_empty:
+            self._closed = True
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+
+    def depth(self) -> int:
+        return len(self._queue)
+
+    def metrics(self) -> Dict[str, int]:
+        with self._not_empty:
+            return {
+                "depth": len(self._queue),
+                "max_depth": self._max_depth,
+                "received": self._received,
+                "delivered": self._delivered,
+                "dropped": self._dropped,
+                "overwritten": self._overwritten,
+            }
+
+
+class MailboxObserver(Observer):
+    """
+    Wraps any observer with a mailbox and a worker thread. The publisher only
+    pays for a snapshot of its state and a queue insert, the wrapped observer
+    receives the snapshots in its own thread.
+    """
+
+    def __init__(self, observer: Observer, maxsize: int = 64,
+                 policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST) -> None:
+        self._observer = observer
+        self.mailbox = Mailbox(maxsize, policy)
+        self.errors = 0
+        self.last_error: Exception = None
+        self._worker = threading.Thread(
+            target=self._drain, name=f"mailbox-{type(observer).__name__}", daemon=True
+        )
+        self._worker.start()
+
+    def update(self, subject: Subject) -> None:
+        # The subject keeps changing, so the observer must get the state as it
+        # was at the moment of the notification.
+        self.mailbox.put(copy.copy(subject))
+
+    def _drain(self) -> None:
+        while True:
+            try:
+                snapshot = self.mailbox.get()
+            except LookupError:
+                return
+            try:
+                self._observer.update(snapshot)
+            except Exception as e:
+                # A failing event must not stop the worker: the mailbox would
+                # fill up and block (or silently drop) everything after it.
+                self.errors += 1
+                self.last_error = e
+
+    def close(self, wait: bool = True) -> None:
+        """
+        Stops accepting events. Events already in the mailbox are still
+        delivered before the worker exits.
+        """
+        self.mailbox.close()
+        if wait:
+            self._worker.join()
+
+    def metrics(self) -> Dict[str, int]:
+        metrics = self.mailbox.metrics()
+        metrics["errors"] = self.errors
+        return metrics
+
+
+"""
+A deliberately slow subscriber to show the overflow policies in action.
+"""
+
+
+class SlowObserver(Observer):
+    def __init__(self, delay: float) -> None:
+        self._delay = delay
+        self.seen = []
+
+    def update(self, subject: Subject) -> None:
+        time.sleep(self._delay)
+        self.seen.append(subject._state)
+
+
+"""
+A subscriber that fails now and then, its worker must keep going.
+"""
+
+
+class FlakyObserver(Observer):
+    def update(self, subject: Subject) -> None:
+        if subject._state % 100 == 0:
+            raise RuntimeError(f"Cannot handle state {subject._state}")
+
+
+if __name__ == "__main__":
+    for policy in OverflowPolicy:
+        subject = ConcreteSubject()
+        subject._observers = []
+        slow = SlowObserver(0.001)
+        observer = MailboxObserver(slow, maxsize=8, policy=policy)
+        subject.attach(observer)
+
+        start = time.perf_counter()
+        for state in range(1000):
+            subject._state = state
+            observer.update(subject)
+        publish_time = time.perf_counter() - start
+        observer.close()
+
+        print(f"{policy.name}: published 1000 events in {publish_time * 1000:.1f} ms, "
+              f"metrics: {observer.metrics()}, last seen: {slow.seen[-3:]}")
+
+    subject = ConcreteSubject()
+    observer = MailboxObserver(FlakyObserver(), maxsize=2, policy=OverflowPolicy.BLOCK)
+    for state in range(1000):
+        subject._state = state
+        observer.update(subject)
+    observer.close()
+    print(f"Failing observer: metrics: {observer.metrics()}, last error: {observer.last_error!r}")
@@ -0,0 +1,83 @@
+"""
+Generative (creational) design patterns.
+
+Public classes are available from the package itself, but are imported lazily:
+`import generative` loads none of the pattern modules, `generative.SomePrototype`
+imports `generative.prototype` on first access.
+"""
+
+from lazy_exports import lazy_attributes
+
+# Public name -> module of this package that defines it.
+_EXPORTS = {
+    "AbstractFactory": "abstract_factory",
+    "ConcreteFactory1": "abstract_factory",
+    "ConcreteFactory2": "abstract_factory",
+    "AbstractProductA": "abstract_factory",
+    "ConcreteProductA1": "abstract_factory",
+    "ConcreteProductA2": "abstract_factory",
+    "AbstractProductB": "abstract_factory",
+    "ConcreteProductB1": "abstract_factory",
+    "ConcreteProductB2": "abstract_factory",
+    "StatusBar": "abstract_factory_example",
+    "MainMenu": "abstract_factory_example",
+    "MainWindow": "abstract_factory_example",
+    "GuiAbstractFactory": "abstract_factory_example",
+    "WindowsGuiFactory": "abstract_factory_example",
+    "LinuxGuiFactory": "abstract_factory_example",
+    "Application": "abstract_factory_example",
+    "create_factory": "abstract_factory_example",
+    "ObjectPool": "abstract_factory_pool",
+    "PooledAbstractFactory": "abstract_factory_pool",
+    "PooledGuiFactory": "abstract_factory_pool",
+    "FactoryRegistry": "abstract_factory_registry",
+    "AsyncSingleton": "async_singleton",
+    "PizzaBatch": "builder_batch",
+    "BatchDirector": "builder_batch",
+    "export_pizzas": "builder_export",
+    "read_binary": "builder_export",
+    "FrozenPizza": "builder_flyweight",
+    "FlyweightDirector": "builder_flyweight",
+    "OrderRejected": "builder_ingest",
+    "OrderIngestor": "builder_ingest",
+    "NameTable": "builder_packed",
+    "PackedPizzas": "builder_packed",
+    "pack_pizza": "builder_packed",
+    "unpack_pizza": "builder_packed",
+    "PipelineDirector": "builder_pipeline",
+    "StagedDirector": "builder_staged",
+    "PizzaBase": "builder_with_director",
+    "PizzaDoughDepth": "builder_with_director",
+    "PizzaDoughType": "builder_with_director",
+    "PizzaSauceType": "builder_with_director",
+    "PizzaTopLevelType": "builder_with_director",
+    "Builder": "builder_with_director",
+    "MargaritaPizzaBuilder": "builder_with_director",
+    "SalamiPizzaBuilder": "builder_with_director",
+    "Director": "builder_with_director",
+    "Creator": "factory_method",
+    "ConcreteCreator1": "factory_method",
+    "ConcreteCreator2": "factory_method",
+    "Product": "factory_method",
+    "ConcreteProduct1": "factory_method",
+    "ConcreteProduct2": "factory_method",
+    "ProductBatch": "factory_method",
+    "MultitonMeta": "multiton",
+    "SelfReferencingEntity": "prototype",
+    "SomePrototype": "prototype",
+    "CowList": "prototype_cow",
+    "CowPrototype": "prototype_cow",
+    "cow_clone": "prototype_cow",
+    "PrototypeRegistry": "prototype_registry",
+    "compile_clone": "prototype_registry",
+    "clone_many": "prototype_registry",
+    "clone_many_parallel": "prototype_registry",
+    "ReadOnlyBuffer": "prototype_shared",
+    "SharedPrototype": "prototype_shared",
+    "SingletonMeta": "singleton",
+    "Singleton": "singleton",
+}
+
+__all__ = sorted(_EXPORTS)
+
+__getattr__, __dir__ = lazy_attributes(__name__, _EXPORTS)
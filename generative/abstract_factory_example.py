@@ -1,5 +1,9 @@
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
 
+from generative.abstract_factory_registry import FactoryRegistry
+
 """
 Base Graphical User Interface Classes
 """
@@ -137,6 +141,13 @@ A client class using a factory to create a GUI
 
 
 class Application:
+    # Widgets that must be created before the given one.
+    WIDGET_DEPENDENCIES = {
+        "main_window": (),
+        "main_menu": ("main_window",),
+        "status_bar": ("main_window",),
+    }
+
     def __init__(self, factory: GuiAbstractFactory):
         self._gui_factory = factory
 
@@ -148,13 +159,58 @@ class Application:
         main_menu.create()
         status_bar.create()
 
+    def create_gui_parallel(self, dependencies: dict[str, tuple[str, ...]] | None = None) -> dict[str, float]:
+        """
+        Constructs all widgets at once in worker threads and calls `create`
+        on each of them as soon as the widgets it depends on are created.
+        Returns the time (in seconds from the start) each widget was ready at.
+        """
+        # Imported here: concurrent.futures pulls in logging, too much for
+        # every user of the factories.
+        import time
+        from concurrent.futures import Future, ThreadPoolExecutor
+
+        dependencies = self.WIDGET_DEPENDENCIES if dependencies is None else dependencies
+        getters = {
+            "main_window": self._gui_factory.getMainWindow,
+            "main_menu": self._gui_factory.getMainMenu,
+            "status_bar": self._gui_factory.getStatusBar,
+        }
+        started = time.perf_counter()
+        with ThreadPoolExecutor(2 * len(getters)) as pool:
+            widgets = {name: pool.submit(getter) for name, getter in getters.items()}
+            created: dict[str, Future] = {}
+
+            def create(name: str) -> float:
+                for dependency in dependencies.get(name, ()):
+                    created[dependency].result()
+                widgets[name].result().create()
+                return time.perf_counter() - started
+
+            pending = list(getters)
+            while pending:
+                ready = [name for name in pending if all(it in created for it in dependencies.get(name, ()))]
+                if not ready:
+                    raise ValueError(f"Circular widget dependencies between {pending}")
+                for name in ready:
+                    created[name] = pool.submit(create, name)
+                    pending.remove(name)
+            return {name: future.result() for name, future in created.items()}
+
+
+"""
+Registry of GUI families. Families living in other modules can be added with
+a dotted path or an entry point and are imported on first use.
+"""
+
+gui_factories = FactoryRegistry(GuiAbstractFactory)
+gui_factories.register("Windows", WindowsGuiFactory)
+gui_factories.register("Linux", LinuxGuiFactory)
+gui_factories.register_entry_points("python_design_patterns.gui_factories")
+
 
 def create_factory(system_name: str) -> GuiAbstractFactory:
-    factory_dict = {
-        "Windows": WindowsGuiFactory,
-        "Linux": LinuxGuiFactory
-    }
-    return factory_dict[system_name]()
+    return gui_factories.create(system_name)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,69 @@
+"""
+Time to first paint of Application.create_gui versus create_gui_parallel for
+a GUI family whose widgets do I/O: constructors load theme assets and
+`create` loads fonts.
+"""
+
+import time
+
+from generative.abstract_factory_example import Application, GuiAbstractFactory, MainMenu, MainWindow, \
+    StatusBar
+
+THEME_LOADING = 0.05
+FONT_LOADING = 0.1
+
+
+class ThemedWidget:
+    def __init__(self):
+        super().__init__("Themed")
+        time.sleep(THEME_LOADING)
+
+    def create(self):
+        time.sleep(FONT_LOADING)
+        self.created_at = time.perf_counter()
+        print(f'Created {type(self).__name__} for {self._system}')
+
+
+class ThemedStatusBar(ThemedWidget, StatusBar):
+    pass
+
+
+class ThemedMainMenu(ThemedWidget, MainMenu):
+    pass
+
+
+class ThemedMainWindow(ThemedWidget, MainWindow):
+    pass
+
+
+class ThemedGuiFactory(GuiAbstractFactory):
+    def __init__(self):
+        self.widgets = []
+
+    def _keep(self, widget):
+        self.widgets.append(widget)
+        return widget
+
+    def getStatusBar(self) -> StatusBar:
+        return self._keep(ThemedStatusBar())
+
+    def getMainMenu(self) -> MainMenu:
+        return self._keep(ThemedMainMenu())
+
+    def getMainWindow(self) -> MainWindow:
+        return self._keep(ThemedMainWindow())
+
+
+if __name__ == '__main__':
+    factory = ThemedGuiFactory()
+    start = time.perf_counter()
+    Application(factory).create_gui()
+    sequential_total = time.perf_counter() - start
+    window = next(it for it in factory.widgets if isinstance(it, MainWindow))
+    sequential_first_paint = window.created_at - start
+    print('---------------------------')
+
+    timings = Application(ThemedGuiFactory()).create_gui_parallel()
+    print('---------------------------')
+    print(f"Sequential: first paint {sequential_first_paint:.2f} s, whole GUI {sequential_total:.2f} s")
+    print(f"Parallel:   first paint {timings['main_window']:.2f} s, whole GUI {max(timings.values()):.2f} s")
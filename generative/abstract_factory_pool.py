@@ -0,0 +1,180 @@
+"""
+Pooling layer for abstract factories.
+
+Concrete factories allocate a new product on every call even when the product
+has no state of its own, like ConcreteProductA1 or the GUI widgets. The
+pooled factories wrap any existing factory: stateless products are created
+once and shared as flyweights, stateful ones are recycled through a bounded
+object pool with a reset hook.
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, List, Tuple
+
+from generative.abstract_factory import AbstractFactory, AbstractProductA, AbstractProductB, ConcreteFactory1
+from generative.abstract_factory_example import GuiAbstractFactory, LinuxGuiFactory, MainMenu, MainWindow, \
+    StatusBar
+
+
+class ObjectPool:
+    """
+    A bounded free list of products. `release` runs the reset hook and keeps
+    the product for the next `acquire` unless the pool is already full.
+    Releasing a product that is already free raises ValueError, otherwise two
+    callers would get the same product.
+    """
+
+    def __init__(self, create: Callable[[], object], maxsize: int = 16,
+                 reset: Callable[[object], None] = None):
+        self._create = create
+        self._reset = reset
+        self._maxsize = maxsize
+        self._free: List[object] = []
+        self.created = 0
+        self.reused = 0
+        self.discarded = 0
+
+    def acquire(self):
+        if self._free:
+            self.reused += 1
+            return self._free.pop()
+        self.created += 1
+        return self._create()
+
+    def release(self, product) -> None:
+        if any(it is product for it in self._free):
+            raise ValueError(f"{type(product).__name__} object was already released")
+        if len(self._free) >= self._maxsize:
+            self.discarded += 1
+            return
+        if self._reset is not None:
+            self._reset(product)
+        self._free.append(product)
+
+    @contextmanager
+    def lease(self):
+        product = self.acquire()
+        try:
+            yield product
+        finally:
+            self.release(product)
+
+    def stats(self) -> Dict[str, int]:
+        return {"created": self.created, "reused": self.reused, "discarded": self.discarded, "free": len(self._free)}
+
+
+class _PoolingMixin:
+    """
+    Product bookkeeping shared by the pooled factories. Every factory method
+    is either a flyweight (created once) or backed by an ObjectPool.
+    """
+
+    def _init_pooling(self, factory, methods: Iterable[str], stateful: Iterable[str],
+                      pool_size: int, reset: Callable[[object], None]) -> None:
+        stateful = set(stateful)
+        unknown = stateful - set(methods)
+        if unknown:
+            raise ValueError(f"Unknown factory methods: {sorted(unknown)}")
+        self._factory = factory
+        self._flyweights: Dict[str, object] = {}
+        self._pools: Dict[str, ObjectPool] = {
+            name: ObjectPool(getattr(factory, name), pool_size, reset) for name in stateful
+        }
+        # Leased products are kept alive here: a product collected while
+        # leased could otherwise leave its id to an unrelated object.
+        self._leased: Dict[int, Tuple[object, ObjectPool]] = {}
+
+    def _product(self, method: str):
+        product = self._flyweights.get(method)
+        if product is not None:
+            return product
+        pool = self._pools.get(method)
+        if pool is not None:
+            product = pool.acquire()
+            self._leased[id(product)] = (product, pool)
+            return product
+        product = self._flyweights[method] = getattr(self._factory, method)()
+        return product
+
+    def release(self, product) -> None:
+        """
+        Returns a stateful product to its pool. Flyweights need no release,
+        they are ignored like products that are not leased (any more).
+        """
+        leased = self._leased.pop(id(product), None)
+        if leased is not None:
+            leased[1].release(product)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        report = {name: {"created": 1} for name in self._flyweights}
+        report.update({name: pool.stats() for name, pool in self._pools.items()})
+        return report
+
+
+def _default_reset(product) -> None:
+    reset = getattr(product, "reset", None)
+    if reset is not None:
+        reset()
+
+
+class PooledAbstractFactory(_PoolingMixin, AbstractFactory):
+
+    def __init__(self, factory: AbstractFactory, stateful: Iterable[str] = (), pool_size: int = 16,
+                 reset: Callable[[object], None] = _default_reset):
+        self._init_pooling(factory, ("create_product_a", "create_product_b"), stateful, pool_size, reset)
+
+    def create_product_a(self) -> AbstractProductA:
+        return self._product("create_product_a")
+
+    def create_product_b(self) -> AbstractProductB:
+        return self._product("create_product_b")
+
+
+class PooledGuiFactory(_PoolingMixin, GuiAbstractFactory):
+
+    def __init__(self, factory: GuiAbstractFactory, stateful: Iterable[str] = ("getMainWindow",),
+                 pool_size: int = 4, reset: Callable[[object], None] = _default_reset):
+        self._init_pooling(factory, ("getStatusBar", "getMainMenu", "getMainWindow"), stateful, pool_size, reset)
+
+    def getStatusBar(self) -> StatusBar:
+        return self._product("getStatusBar")
+
+    def getMainMenu(self) -> MainMenu:
+        return self._product("getMainMenu")
+
+    def getMainWindow(self) -> MainWindow:
+        return self._product("getMainWindow")
+
+
+def _measure(factory: AbstractFactory, calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        product_a = factory.create_product_a()
+        factory.create_product_b().another_useful_function_b(product_a)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    calls = 500_000
+    plain = ConcreteFactory1()
+    pooled = PooledAbstractFactory(plain)
+    print(f"Products are shared: {pooled.create_product_a() is pooled.create_product_a()}")
+
+    plain_time = _measure(plain, calls)
+    pooled_time = _measure(pooled, calls)
+    allocations = sum(it["created"] for it in pooled.stats().values())
+    print(f"{calls} product pairs: plain {plain_time:.3f} s, {2 * calls} allocations; "
+          f"pooled {pooled_time:.3f} s, {allocations} allocations")
+
+    for name, gui in (("plain", LinuxGuiFactory()), ("pooled", PooledGuiFactory(LinuxGuiFactory()))):
+        start = time.perf_counter()
+        for _ in range(calls):
+            window = gui.getMainWindow()
+            gui.getStatusBar()
+            gui.getMainMenu()
+            if name == "pooled":
+                gui.release(window)
+        elapsed = time.perf_counter() - start
+        allocations = sum(it["created"] for it in gui.stats().values()) if name == "pooled" else 3 * calls
+        print(f"{calls} GUI sets, {name}: {elapsed:.3f} s, {allocations} allocations")
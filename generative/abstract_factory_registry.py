@@ -0,0 +1,161 @@
+"""
+Registry of abstract factories that are imported only when requested.
+
+Factory families are registered by name with a dotted path
+("package.module:ClassName" or "package.module.ClassName"), with an entry
+point group, or directly with the class. Nothing is imported at registration
+time (entry point groups are not even scanned); the first `get` imports the
+module, checks the class and caches it.
+"""
+
+from __future__ import annotations
+
+import importlib
+import time
+from collections.abc import Callable, Iterator
+
+
+class FactoryRegistry:
+
+    def __init__(self, base: type | None = None):
+        """
+        With `base` given, every resolved factory must be a subclass of it.
+        """
+        self._base = base
+        self._loaders: dict[str, Callable[[], type]] = {}
+        self._resolved: dict[str, type] = {}
+        self._groups: list[str] = []
+        self.import_times: dict[str, float] = {}
+
+    def register(self, name: str, target: str | type) -> None:
+        if isinstance(target, str):
+            self._loaders[name] = lambda: _import_dotted(target)
+        else:
+            self._loaders[name] = lambda: target
+        self._resolved.pop(name, None)
+
+    def register_entry_points(self, group: str) -> None:
+        """
+        Registers every entry point of the group under its name. Installed
+        distributions are scanned only when a name is not found otherwise,
+        and each entry point is loaded on first use.
+        """
+        self._groups.append(group)
+
+    def _scan_entry_points(self) -> None:
+        if not self._groups:
+            return
+        from importlib import metadata  # not cheap to import, so only when needed
+        while self._groups:
+            for entry_point in metadata.entry_points(group=self._groups.pop(0)):
+                self._loaders.setdefault(entry_point.name, entry_point.load)
+
+    def get(self, name: str) -> type:
+        factory = self._resolved.get(name)
+        if factory is not None:
+            return factory
+        if name not in self._loaders:
+            self._scan_entry_points()
+        try:
+            loader = self._loaders[name]
+        except KeyError:
+            raise KeyError(f"Unknown factory family {name!r}") from None
+        started = time.perf_counter()
+        factory = loader()
+        self.import_times[name] = time.perf_counter() - started
+        if self._base is not None and not (isinstance(factory, type) and issubclass(factory, self._base)):
+            raise TypeError(f"{name!r} resolved to {factory!r}, which is not a {self._base.__name__}")
+        self._resolved[name] = factory
+        return factory
+
+    def create(self, name: str, *args, **kwargs):
+        return self.get(name)(*args, **kwargs)
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._resolved
+
+    def __contains__(self, name: str) -> bool:
+        if name not in self._loaders:
+            self._scan_entry_points()
+        return name in self._loaders
+
+    def __iter__(self) -> Iterator[str]:
+        self._scan_entry_points()
+        return iter(list(self._loaders))
+
+    def __len__(self) -> int:
+        self._scan_entry_points()
+        return len(self._loaders)
+
+
+def _import_dotted(path: str) -> type:
+    if ":" in path:
+        module_name, _, attribute = path.partition(":")
+    else:
+        module_name, _, attribute = path.rpartition(".")
+    if not module_name or not attribute:
+        raise ValueError(f"{path!r} is not a dotted path to a class")
+    obj = importlib.import_module(module_name)
+    for part in attribute.split("."):
+        obj = getattr(obj, part)
+    return obj
+
+
+_PLUGIN_TEMPLATE = '''
+import json, decimal, fractions, statistics
+
+# Theme tables, fonts and so on are loaded when the module is imported.
+ASSETS = [hash(str(i)) for i in range(20000)]
+
+
+from generative.abstract_factory_example import GuiAbstractFactory, LinuxMainMenu, LinuxMainWindow, \\
+    LinuxStatusBar
+
+
+class Family{index}GuiFactory(GuiAbstractFactory):
+    def getStatusBar(self):
+        return LinuxStatusBar()
+
+    def getMainMenu(self):
+        return LinuxMainMenu()
+
+    def getMainWindow(self):
+        return LinuxMainWindow()
+'''
+
+
+if __name__ == "__main__":
+    import os
+    import sys
+    import tempfile
+
+    from generative.abstract_factory_example import Application, GuiAbstractFactory
+
+    families = 60
+    with tempfile.TemporaryDirectory() as directory:
+        for index in range(families):
+            with open(os.path.join(directory, f"gui_family_{index}.py"), "w") as plugin:
+                plugin.write(_PLUGIN_TEMPLATE.format(index=index))
+        sys.path.insert(0, directory)
+
+        registry = FactoryRegistry(GuiAbstractFactory)
+        start = time.perf_counter()
+        for index in range(families):
+            registry.register(f"family{index}", f"gui_family_{index}:Family{index}GuiFactory")
+        lazy_startup = time.perf_counter() - start
+
+        start = time.perf_counter()
+        Application(registry.create("family7")).create_gui()
+        first_request = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for name in registry:
+            registry.get(name)
+        eager_startup = time.perf_counter() - start + registry.import_times["family7"]
+
+        sys.path.remove(directory)
+
+    print(f"{families} families registered lazily in {lazy_startup * 1000:.2f} ms, "
+          f"first request (one import) took {first_request * 1000:.2f} ms")
+    print(f"Importing all of them up front takes {eager_startup * 1000:.1f} ms, "
+          f"startup saves {(eager_startup - lazy_startup) * 1000:.1f} ms")
@@ -0,0 +1,108 @@
+"""
+Asynchronous singleton: the single instance is created lazily by the first
+`await Cls.instance()`, and its slow asynchronous setup runs exactly once.
+Everybody who asks for the instance while it is still being initialized
+waits for the same in-flight future.
+"""
+
+from __future__ import annotations
+import asyncio
+import time
+from typing import Dict, List, Type, TypeVar
+
+T = TypeVar("T", bound="AsyncSingleton")
+
+
+class AsyncSingleton:
+    """
+    Base class for singletons with asynchronous initialization.
+    Subclasses put their slow setup (warm-up of connections, loading of
+    caches, ...) into `initialize`.
+    """
+    _futures: Dict[type, asyncio.Future] = {}
+
+    async def initialize(self) -> None:
+        pass
+
+    @classmethod
+    async def instance(cls: Type[T]) -> T:
+        future = AsyncSingleton._futures.get(cls)
+        if future is None:
+            future = asyncio.ensure_future(cls._create())
+            AsyncSingleton._futures[cls] = future
+        # The initialization is shared, so cancelling one of the awaiters
+        # must not cancel it for all the others.
+        return await asyncio.shield(future)
+
+    @classmethod
+    async def _create(cls: Type[T]) -> T:
+        try:
+            instance = cls()
+            await instance.initialize()
+        except BaseException:
+            # Let the next caller try again instead of caching the failure.
+            AsyncSingleton._futures.pop(cls, None)
+            raise
+        return instance
+
+    @classmethod
+    def is_initialized(cls) -> bool:
+        future = AsyncSingleton._futures.get(cls)
+        return future is not None and future.done() and not future.cancelled() \
+            and future.exception() is None
+
+
+async def warm_up(*classes: Type[AsyncSingleton]) -> List[AsyncSingleton]:
+    """
+    Eagerly initializes a set of singletons in parallel, e.g. during startup.
+    """
+    return list(await asyncio.gather(*(cls.instance() for cls in classes)))
+
+
+"""
+Singletons with slow asynchronous setup
+"""
+
+
+class DatabasePool(AsyncSingleton):
+    initializations = 0
+
+    async def initialize(self) -> None:
+        await asyncio.sleep(0.3)
+        DatabasePool.initializations += 1
+        self.connections = ["connection"] * 5
+
+
+class ProductCache(AsyncSingleton):
+    initializations = 0
+
+    async def initialize(self) -> None:
+        await asyncio.sleep(0.2)
+        ProductCache.initializations += 1
+        self.products = {"Margarita": 10, "Salami": 12}
+
+
+class ThemeAssets(AsyncSingleton):
+    initializations = 0
+
+    async def initialize(self) -> None:
+        await asyncio.sleep(0.25)
+        ThemeAssets.initializations += 1
+        self.fonts = ["Sans", "Mono"]
+
+
+async def main() -> None:
+    instances = await asyncio.gather(*(DatabasePool.instance() for _ in range(100)))
+    if all(it is instances[0] for it in instances):
+        print(f"100 concurrent awaiters got the same instance, "
+              f"initialized {DatabasePool.initializations} time(s).")
+
+    start = time.perf_counter()
+    await warm_up(ProductCache, ThemeAssets)
+    print(f"Warm-up of ProductCache and ThemeAssets took {time.perf_counter() - start:.2f} s "
+          f"(sequentially it would be ~0.45 s)")
+    print(f"ProductCache initialized: {ProductCache.is_initialized()}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,194 @@
+"""
+Bulk export of built pizzas (from either builder module) as text receipts,
+CSV, JSONL or a compact binary format.
+
+`Pizza.__str__` formats every line from scratch. Pizzas repeat the same
+doughs, sauces and toppings over and over, so the exporters cache the
+rendered fragments per value and write large chunks through buffered I/O.
+"""
+
+import csv
+import io
+import json
+import os
+import struct
+import sys
+import tempfile
+import time
+from array import array
+from typing import Callable, Dict, Iterable, List
+
+from generative.builder_packed import NameTable, PackedPizzas, pack_pizza
+from generative.builder_with_director import Director, MargaritaPizzaBuilder, SalamiPizzaBuilder
+
+FORMATS = ("text", "csv", "jsonl", "binary")
+CSV_HEADER = ("name", "dough_depth", "dough_type", "sauce", "topping", "cooking_time")
+BINARY_MAGIC = b"PIZZA01\n"
+_FOOTER = struct.Struct("<Q")
+_CHUNK = 4096
+_BUFFER_SIZE = 1 << 20
+
+
+class _FragmentCache(dict):
+    """
+    A dict that renders missing values with the given function.
+    """
+
+    def __init__(self, render: Callable):
+        super().__init__()
+        self._render = render
+
+    def __missing__(self, key):
+        value = self[key] = self._render(key)
+        return value
+
+
+def _write_text(pizzas: Iterable, stream: io.TextIOBase) -> None:
+    # Exactly what `print(pizza)` produces, one receipt after another.
+    dough = _FragmentCache(lambda it: f"dough type: {it.DoughDepth.name} & {it.DoughType.name}\n")
+    sauce = _FragmentCache(lambda it: f"sauce type: {it} \n")
+    topping = _FragmentCache(lambda it: f"topping: {[item.name for item in it]} \n")
+    chunk: List[str] = []
+    for pizza in pizzas:
+        chunk.append(f"Pizza name: {pizza.name} \n{dough[pizza.dough]}{sauce[pizza.sauce]}"
+                     f"{topping[tuple(pizza.topping)]}cooking time: {pizza.cooking_time} minutes\n")
+        if len(chunk) >= _CHUNK:
+            stream.write("".join(chunk))
+            chunk.clear()
+    stream.write("".join(chunk))
+
+
+def _write_csv(pizzas: Iterable, stream: io.TextIOBase) -> None:
+    writer = csv.writer(stream, lineterminator="\n")
+    writer.writerow(CSV_HEADER)
+    dough = _FragmentCache(lambda it: (it.DoughDepth.name, it.DoughType.name))
+    topping = _FragmentCache(lambda it: ";".join(item.name for item in it))
+    chunk = []
+    for pizza in pizzas:
+        depth, dough_type = dough[pizza.dough]
+        chunk.append((pizza.name, depth, dough_type, pizza.sauce.name,
+                      topping[tuple(pizza.topping)], pizza.cooking_time))
+        if len(chunk) >= _CHUNK:
+            writer.writerows(chunk)
+            chunk.clear()
+    writer.writerows(chunk)
+
+
+def _write_jsonl(pizzas: Iterable, stream: io.TextIOBase) -> None:
+    # The same field layout that `builder_ingest` reads.
+    name = _FragmentCache(lambda it: '{"name": ' + json.dumps(it))
+    body = _FragmentCache(lambda it: ', "dough": ' + json.dumps([it[0].DoughDepth.name, it[0].DoughType.name])
+                          + ', "sauce": ' + json.dumps(it[1].name)
+                          + ', "topping": ' + json.dumps([item.name for item in it[2]])
+                          + ', "cooking_time": ' + json.dumps(it[3]) + "}\n")
+    chunk: List[str] = []
+    for pizza in pizzas:
+        chunk.append(name[pizza.name] + body[pizza.dough, pizza.sauce, tuple(pizza.topping), pizza.cooking_time])
+        if len(chunk) >= _CHUNK:
+            stream.write("".join(chunk))
+            chunk.clear()
+    stream.write("".join(chunk))
+
+
+def _write_binary(pizzas: Iterable, stream: io.BufferedIOBase) -> None:
+    """
+    The magic, then the packed 64-bit codes from `builder_packed` in little
+    endian order, then the name table as JSON and its length.
+    """
+    names = NameTable()
+    stream.write(BINARY_MAGIC)
+    codes = array("Q")
+    known: Dict[tuple, int] = {}
+    for pizza in pizzas:
+        key = pizza.name, pizza.dough, pizza.sauce, tuple(pizza.topping), pizza.cooking_time
+        code = known.get(key)
+        if code is None:
+            code = known[key] = pack_pizza(pizza, names)
+        codes.append(code)
+        if len(codes) >= _CHUNK:
+            stream.write(_little_endian(codes).tobytes())
+            del codes[:]
+    stream.write(_little_endian(codes).tobytes())
+    table = json.dumps(list(names)).encode()
+    stream.write(table)
+    stream.write(_FOOTER.pack(len(table)))
+
+
+def _little_endian(codes: array) -> array:
+    if sys.byteorder == "big":
+        codes = array("Q", codes)
+        codes.byteswap()
+    return codes
+
+
+_WRITERS: Dict[str, Callable] = {
+    "text": _write_text,
+    "csv": _write_csv,
+    "jsonl": _write_jsonl,
+    "binary": _write_binary,
+}
+
+
+def export_pizzas(pizzas: Iterable, path: str, format: str = "text") -> int:
+    """
+    Streams the pizzas into the file at `path` and returns its size in bytes.
+    """
+    if format not in _WRITERS:
+        raise ValueError(f"Unknown export format {format!r}, expected one of {FORMATS}")
+    if format == "binary":
+        stream = open(path, "wb", buffering=_BUFFER_SIZE)
+    else:
+        stream = open(path, "w", encoding="utf-8", newline="", buffering=_BUFFER_SIZE)
+    with stream:
+        _WRITERS[format](pizzas, stream)
+    return os.path.getsize(path)
+
+
+def read_binary(path: str) -> PackedPizzas:
+    with open(path, "rb") as stream:
+        data = stream.read()
+    if not data.startswith(BINARY_MAGIC):
+        raise ValueError(f"{path} is not a binary pizza export")
+    (table_length,) = _FOOTER.unpack_from(data, len(data) - _FOOTER.size)
+    table_start = len(data) - _FOOTER.size - table_length
+    names = NameTable()
+    for name in json.loads(data[table_start:len(data) - _FOOTER.size]):
+        names.index(name)
+    codes = array("Q", data[len(BINARY_MAGIC):table_start])
+    return PackedPizzas(_little_endian(codes), names)
+
+
+if __name__ == "__main__":
+    director = Director()
+    menu = []
+    for it in (MargaritaPizzaBuilder, SalamiPizzaBuilder):
+        builder = it()
+        director.set_builder(builder)
+        director.make_pizza()
+        menu.append(builder.get_pizza())
+    pizzas = menu * 250_000
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "receipts")
+        start = time.perf_counter()
+        with open(path, "w", encoding="utf-8") as stream:
+            for pizza in pizzas:
+                print(pizza, file=stream)
+        elapsed = time.perf_counter() - start
+        baseline = os.path.getsize(path)
+        print(f"print(pizza): {baseline / elapsed / 1e6:.1f} MB/s, {len(pizzas) / elapsed:,.0f} pizzas/s")
+        with open(path, encoding="utf-8") as stream:
+            expected = stream.read()
+
+        for format in FORMATS:
+            start = time.perf_counter()
+            size = export_pizzas(pizzas, path, format)
+            elapsed = time.perf_counter() - start
+            print(f"{format}: {size / elapsed / 1e6:.1f} MB/s, {len(pizzas) / elapsed:,.0f} pizzas/s, "
+                  f"{size / len(pizzas):.1f} bytes per pizza")
+            if format == "text":
+                with open(path, encoding="utf-8") as stream:
+                    print(f"text export matches print(pizza): {stream.read() == expected}")
+
+        restored = read_binary(path)
+        print(f"binary export round trip: {vars(restored[1]) == vars(pizzas[1])}")
@@ -0,0 +1,113 @@
+"""
+Flyweight products for the Director from `builder_with_director`.
+
+MargaritaPizzaBuilder and SalamiPizzaBuilder always produce identical pizzas,
+yet every run allocates a new Pizza, PizzaBase and topping list. In the
+flyweight mode the Director builds a product once per builder configuration,
+freezes it and hands out the same shared instance afterwards.
+"""
+
+import time
+from typing import Callable, Dict, Hashable
+
+from generative.builder_with_director import Builder, Director, MargaritaPizzaBuilder, Pizza, \
+    SalamiPizzaBuilder
+
+
+class FrozenPizza(Pizza):
+    """
+    Immutable Pizza that can be safely shared between orders.
+    """
+
+    def __init__(self, pizza: Pizza):
+        set_field = super().__setattr__
+        set_field("name", pizza.name)
+        set_field("dough", pizza.dough)
+        set_field("sauce", pizza.sauce)
+        set_field("topping", tuple(pizza.topping))
+        set_field("cooking_time", pizza.cooking_time)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("FrozenPizza is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("FrozenPizza is immutable")
+
+    def _fields(self) -> tuple:
+        return self.name, self.dough, self.sauce, self.topping, self.cooking_time
+
+    def __eq__(self, other):
+        if not isinstance(other, FrozenPizza):
+            return NotImplemented
+        return self._fields() == other._fields()
+
+    def __hash__(self):
+        return hash(self._fields())
+
+
+class FlyweightDirector(Director):
+    """
+    A Director that memoizes frozen products per builder configuration.
+
+    `make_product` receives a builder factory (usually the builder class) and
+    an optional key describing its configuration; the builder is created and
+    driven through all the steps only on a cache miss. With `enabled=False`
+    every call builds a fresh, mutable pizza as the plain Director does.
+    """
+
+    def __init__(self, enabled: bool = True):
+        super().__init__()
+        self.enabled = enabled
+        self._products: Dict[Hashable, FrozenPizza] = {}
+        self._hits = 0
+        self._misses = 0
+
+    def _build(self, builder_factory: Callable[[], Builder]) -> Pizza:
+        builder = builder_factory()
+        self.set_builder(builder)
+        self.make_pizza()
+        return builder.get_pizza()
+
+    def make_product(self, builder_factory: Callable[[], Builder], key: Hashable = None) -> Pizza:
+        if not self.enabled:
+            return self._build(builder_factory)
+        if key is None:
+            key = builder_factory
+        product = self._products.get(key)
+        if product is not None:
+            self._hits += 1
+            return product
+        self._misses += 1
+        product = self._products[key] = FrozenPizza(self._build(builder_factory))
+        return product
+
+    def cache_info(self) -> Dict[str, int]:
+        return {"hits": self._hits, "misses": self._misses, "size": len(self._products)}
+
+    def cache_clear(self) -> None:
+        self._products.clear()
+        self._hits = self._misses = 0
+
+
+def _build_menus(director: FlyweightDirector, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for builder_type in (MargaritaPizzaBuilder, SalamiPizzaBuilder):
+            director.make_product(builder_type)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    director = FlyweightDirector()
+    first = director.make_product(MargaritaPizzaBuilder)
+    second = director.make_product(MargaritaPizzaBuilder)
+    print(f"Products are shared: {first is second}")
+    print(first)
+    print('---------------------------')
+
+    rounds = 100_000
+    plain_time = _build_menus(FlyweightDirector(enabled=False), rounds)
+    director.cache_clear()
+    flyweight_time = _build_menus(director, rounds)
+    print(f"{rounds} menu builds: plain {plain_time:.3f} s, flyweight {flyweight_time:.3f} s, "
+          f"x{plain_time / flyweight_time:.0f} faster, {director.cache_info()}")
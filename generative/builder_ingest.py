@@ -0,0 +1,162 @@
+"""
+Streaming ingestion of pizza orders from a JSONL feed.
+
+Every line of the feed is one order:
+
+    {"name": "Margarita", "dough": ["THICK", "WHEAT"], "sauce": "TOMATO",
+     "topping": ["MOZZARELLA", "BACON"], "cooking_time": 10}
+
+The orders are parsed one at a time, mapped onto the `_Builder` from
+`builder_without_director` and yielded as built pizzas, so memory use does not
+depend on the size of the feed. Malformed orders are rejected and counted
+without stopping the stream.
+"""
+
+import json
+import os
+import tempfile
+import time
+from collections import deque
+from typing import Callable, Deque, Iterable, Iterator, Union
+
+from generative.builder_with_director import PizzaBase, PizzaDoughDepth, PizzaDoughType, PizzaSauceType, \
+    PizzaTopLevelType
+from generative.builder_without_director import Pizza
+
+
+class OrderRejected(ValueError):
+    """
+    A single order that could not be turned into a pizza.
+    """
+
+    def __init__(self, line_number: int, reason: str):
+        super().__init__(f"Order on line {line_number} rejected: {reason}")
+        self.line_number = line_number
+        self.reason = reason
+
+
+def _member(enum, name):
+    if not isinstance(name, str):
+        raise ValueError(f"{enum.__name__} must be given by name, got {name!r}")
+    try:
+        return enum[name]
+    except KeyError:
+        raise ValueError(f"unknown {enum.__name__} {name!r}") from None
+
+
+def build_order(order: dict) -> Pizza:
+    """
+    Maps one parsed order onto the builder.
+    """
+    if not isinstance(order, dict):
+        raise ValueError("order must be a JSON object")
+    try:
+        name = order["name"]
+        depth, dough_type = order["dough"]
+        sauce = order["sauce"]
+        topping = order.get("topping", [])
+        cooking_time = order["cooking_time"]
+    except KeyError as exc:
+        raise ValueError(f"missing field {exc.args[0]!r}") from None
+    except (TypeError, ValueError):
+        raise ValueError("dough must be a [depth, type] pair") from None
+    if not isinstance(name, str):
+        raise ValueError("name must be a string")
+    if not isinstance(topping, list):
+        raise ValueError("topping must be a list")
+    if type(cooking_time) is not int or cooking_time < 0:
+        raise ValueError("cooking_time must be a non-negative integer")
+
+    builder = Pizza.getBuilder()
+    builder.set_name(name)
+    builder.set_dough(PizzaBase(_member(PizzaDoughDepth, depth), _member(PizzaDoughType, dough_type)))
+    builder.set_sauce(_member(PizzaSauceType, sauce))
+    builder.set_topping([_member(PizzaTopLevelType, it) for it in topping])
+    builder.set_cooking_time(cooking_time)
+    return builder.build()
+
+
+class OrderIngestor:
+    """
+    Turns a stream of JSONL lines into pizzas and keeps ingestion statistics.
+    Rejected orders are passed to `on_error` (if given) and the most recent
+    ones are kept in `rejected`.
+    """
+
+    def __init__(self, on_error: Callable[[OrderRejected], None] = None, keep_rejected: int = 100):
+        self.on_error = on_error
+        self.rejected: Deque[OrderRejected] = deque(maxlen=keep_rejected)
+        self.records = 0
+        self.built = 0
+        self.elapsed = 0.0
+
+    @property
+    def rejected_count(self) -> int:
+        return self.records - self.built
+
+    @property
+    def records_per_second(self) -> float:
+        return self.records / self.elapsed if self.elapsed else 0.0
+
+    def ingest(self, lines: Iterable[Union[str, bytes]]) -> Iterator[Pizza]:
+        started = time.perf_counter()
+        try:
+            for line_number, line in enumerate(lines, 1):
+                if not line.strip():
+                    continue
+                self.records += 1
+                try:
+                    pizza = build_order(json.loads(line))
+                except ValueError as exc:
+                    # json.JSONDecodeError and UnicodeDecodeError are ValueErrors as well.
+                    self._reject(OrderRejected(line_number, str(exc)))
+                    continue
+                self.built += 1
+                # Time spent by the consumer between items is not ours.
+                self.elapsed += time.perf_counter() - started
+                started = None
+                yield pizza
+                started = time.perf_counter()
+        finally:
+            # None while suspended at yield: a consumer closing the generator
+            # there must not get its own time counted.
+            if started is not None:
+                self.elapsed += time.perf_counter() - started
+
+    def ingest_file(self, path: str) -> Iterator[Pizza]:
+        with open(path, "rb") as feed:
+            yield from self.ingest(feed)
+
+    def _reject(self, error: OrderRejected) -> None:
+        self.rejected.append(error)
+        if self.on_error is not None:
+            self.on_error(error)
+
+
+if __name__ == "__main__":
+    orders = [
+        {"name": "Margarita", "dough": ["THICK", "WHEAT"], "sauce": "TOMATO",
+         "topping": ["MOZZARELLA", "MOZZARELLA", "BACON"], "cooking_time": 10},
+        {"name": "Salami", "dough": ["THIN", "RYE"], "sauce": "BARBEQUE",
+         "topping": ["MOZZARELLA", "SALAMI"], "cooking_time": 9},
+    ]
+    malformed = ['{"name": "Broken"', '{"name": "Pineapple", "dough": ["THIN", "RYE"], '
+                 '"sauce": "KETCHUP", "cooking_time": 5}']
+
+    count = 500_000
+    with tempfile.NamedTemporaryFile("w", suffix=".jsonl", delete=False) as feed:
+        lines = [json.dumps(order) for order in orders]
+        for i in range(count):
+            feed.write((malformed[i % 2] if i % 1000 == 999 else lines[i % 2]) + "\n")
+
+    try:
+        ingestor = OrderIngestor()
+        cooking_time = 0
+        for pizza in ingestor.ingest_file(feed.name):
+            cooking_time += pizza.cooking_time
+        print(f"Records: {ingestor.records}, built: {ingestor.built}, rejected: {ingestor.rejected_count}")
+        print(f"Last rejection: {ingestor.rejected[-1]}")
+        print(f"Throughput: {ingestor.records_per_second:,.0f} records/s, "
+              f"total cooking time {cooking_time} minutes")
+    finally:
+        os.unlink(feed.name)
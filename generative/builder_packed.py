@@ -0,0 +1,206 @@
+"""
+Compact packed form of the pizzas built in `builder_with_director`.
+
+A built Pizza carries its own `__dict__`, a PizzaBase namedtuple and a topping
+list, which is a lot for an order history of tens of millions of pizzas. The
+packed form keeps the whole pizza in one 64-bit integer:
+
+    bits  0..1   dough depth     (0 - not set)
+    bits  2..3   dough type      (0 - not set)
+    bits  4..6   sauce           (0 - not set)
+    bits  7..14  cooking time    (0 - not set, otherwise time + 1)
+    bits 15..22  name            (index in the name table)
+    bits 23..61  toppings        (up to 13 toppings, 3 bits each, in order)
+
+so a sequence of pizzas is just an `array('Q')` plus a small table of names.
+"""
+
+import time
+import tracemalloc
+from array import array
+from numbers import Integral
+from typing import Dict, Iterator, List
+
+from generative.builder_with_director import Director, MargaritaPizzaBuilder, Pizza, PizzaBase, \
+    PizzaDoughDepth, PizzaDoughType, PizzaSauceType, PizzaTopLevelType, SalamiPizzaBuilder
+
+_DEPTH_SHIFT, _DEPTH_BITS = 0, 2
+_TYPE_SHIFT, _TYPE_BITS = 2, 2
+_SAUCE_SHIFT, _SAUCE_BITS = 4, 3
+_TIME_SHIFT, _TIME_BITS = 7, 8
+_NAME_SHIFT, _NAME_BITS = 15, 8
+_TOPPING_SHIFT, _TOPPING_BITS = 23, 3
+MAX_TOPPINGS = 13
+MAX_NAMES = 1 << _NAME_BITS
+MAX_COOKING_TIME = (1 << _TIME_BITS) - 2
+
+# Decoding tables, shared with the other compact pizza stores: the code of an
+# enum member is its value, 0 stands for None.
+DOUGH_DEPTHS = (None,) + tuple(PizzaDoughDepth)
+DOUGH_TYPES = (None,) + tuple(PizzaDoughType)
+SAUCES = (None,) + tuple(PizzaSauceType)
+TOPPINGS = (None,) + tuple(PizzaTopLevelType)
+
+assert all(member.value == code for table in (DOUGH_DEPTHS, DOUGH_TYPES, SAUCES, TOPPINGS)
+           for code, member in enumerate(table) if member is not None)
+assert len(DOUGH_DEPTHS) <= 1 << _DEPTH_BITS and len(DOUGH_TYPES) <= 1 << _TYPE_BITS
+assert len(SAUCES) <= 1 << _SAUCE_BITS and len(TOPPINGS) <= 1 << _TOPPING_BITS
+
+_DEPTH_MASK = (1 << _DEPTH_BITS) - 1
+_TYPE_MASK = (1 << _TYPE_BITS) - 1
+_SAUCE_MASK = (1 << _SAUCE_BITS) - 1
+_TIME_MASK = (1 << _TIME_BITS) - 1
+_NAME_MASK = (1 << _NAME_BITS) - 1
+_TOPPING_MASK = (1 << _TOPPING_BITS) - 1
+
+
+def enum_code(member) -> int:
+    """
+    The code of an enum member (or None) in the tables above.
+    """
+    return 0 if member is None else member.value
+
+
+class NameTable:
+    """
+    Pizza names are few and repeated, so packed pizzas keep a small index.
+    """
+
+    def __init__(self) -> None:
+        self._names: List[str] = []
+        self._indexes: Dict[str, int] = {}
+
+    def index(self, name: str) -> int:
+        index = self._indexes.get(name)
+        if index is None:
+            if len(self._names) >= MAX_NAMES:
+                raise ValueError(f"Too many distinct pizza names, at most {MAX_NAMES} are supported")
+            index = self._indexes[name] = len(self._names)
+            self._names.append(name)
+        return index
+
+    def name(self, index: int) -> str:
+        return self._names[index]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+
+def pack_pizza(pizza: Pizza, names: NameTable) -> int:
+    if len(pizza.topping) > MAX_TOPPINGS:
+        raise ValueError(f"A packed pizza holds at most {MAX_TOPPINGS} toppings")
+    if pizza.cooking_time is not None and (not isinstance(pizza.cooking_time, Integral)
+                                           or isinstance(pizza.cooking_time, bool)
+                                           or not 0 <= pizza.cooking_time <= MAX_COOKING_TIME):
+        raise ValueError(f"Cooking time must be a whole number of minutes between 0 and {MAX_COOKING_TIME}, "
+                         f"not {pizza.cooking_time!r}")
+
+    depth, dough_type = pizza.dough if pizza.dough is not None else (None, None)
+    code = enum_code(depth) << _DEPTH_SHIFT \
+        | enum_code(dough_type) << _TYPE_SHIFT \
+        | enum_code(pizza.sauce) << _SAUCE_SHIFT \
+        | (0 if pizza.cooking_time is None else pizza.cooking_time + 1) << _TIME_SHIFT \
+        | names.index(pizza.name) << _NAME_SHIFT
+    shift = _TOPPING_SHIFT
+    for topping in pizza.topping:
+        code |= topping.value << shift
+        shift += _TOPPING_BITS
+    return code
+
+
+def unpack_pizza(code: int, names: NameTable) -> Pizza:
+    pizza = Pizza(names.name(code >> _NAME_SHIFT & _NAME_MASK))
+    depth = DOUGH_DEPTHS[code >> _DEPTH_SHIFT & _DEPTH_MASK]
+    dough_type = DOUGH_TYPES[code >> _TYPE_SHIFT & _TYPE_MASK]
+    if depth is not None or dough_type is not None:
+        pizza.dough = PizzaBase(depth, dough_type)
+    pizza.sauce = SAUCES[code >> _SAUCE_SHIFT & _SAUCE_MASK]
+    cooking_time = code >> _TIME_SHIFT & _TIME_MASK
+    pizza.cooking_time = cooking_time - 1 if cooking_time else None
+    toppings = code >> _TOPPING_SHIFT
+    while toppings:
+        pizza.topping.append(TOPPINGS[toppings & _TOPPING_MASK])
+        toppings >>= _TOPPING_BITS
+    return pizza
+
+
+def topping_counts(code: int) -> Dict[PizzaTopLevelType, int]:
+    """
+    Counts toppings straight from the packed form, without building a Pizza.
+    """
+    counts: Dict[PizzaTopLevelType, int] = {}
+    toppings = code >> _TOPPING_SHIFT
+    while toppings:
+        topping = TOPPINGS[toppings & _TOPPING_MASK]
+        counts[topping] = counts.get(topping, 0) + 1
+        toppings >>= _TOPPING_BITS
+    return counts
+
+
+class PackedPizzas:
+    """
+    A sequence of pizzas stored as 8 bytes each.
+    """
+
+    def __init__(self, codes: array = None, names: NameTable = None) -> None:
+        self.names = names if names is not None else NameTable()
+        self._codes = codes if codes is not None else array("Q")
+
+    def append(self, pizza: Pizza) -> None:
+        self._codes.append(pack_pizza(pizza, self.names))
+
+    def extend(self, pizzas) -> None:
+        for pizza in pizzas:
+            self.append(pizza)
+
+    def code(self, index: int) -> int:
+        return self._codes[index]
+
+    def __getitem__(self, index: int) -> Pizza:
+        return unpack_pizza(self._codes[index], self.names)
+
+    def __iter__(self) -> Iterator[Pizza]:
+        for code in self._codes:
+            yield unpack_pizza(code, self.names)
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    def nbytes(self) -> int:
+        return self._codes.itemsize * len(self._codes)
+
+
+def _make_pizzas(count: int) -> List[Pizza]:
+    director = Director()
+    pizzas = []
+    for i in range(count):
+        builder = (MargaritaPizzaBuilder, SalamiPizzaBuilder)[i % 2]()
+        director.set_builder(builder)
+        director.make_pizza()
+        pizzas.append(builder.get_pizza())
+    return pizzas
+
+
+if __name__ == "__main__":
+    count = 200_000
+    sample = _make_pizzas(2)
+    packed = PackedPizzas()
+    packed.extend(sample)
+    print(f"Round trip is lossless: {all(vars(a) == vars(b) for a, b in zip(sample, packed))}")
+    print(packed[0])
+    print('---------------------------')
+
+    tracemalloc.start()
+    pizzas = _make_pizzas(count)
+    objects_memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    packed = PackedPizzas()
+    packed.extend(pizzas)
+    pack_time = time.perf_counter() - start
+    del pizzas
+
+    print(f"Pizza objects: {objects_memory / count:.0f} bytes per pizza")
+    print(f"Packed pizzas: {packed.nbytes() / count:.0f} bytes per pizza, "
+          f"packed {count / pack_time:,.0f} pizzas/s")
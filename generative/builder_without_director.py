@@ -1,5 +1,4 @@
-from generative.builder_with_director import PizzaSauceType, PizzaBase, PizzaDoughDepth, PizzaDoughType, \
-    PizzaTopLevelType
+from __future__ import annotations
 
 
 """
@@ -55,6 +54,9 @@ class _Builder:
 
 
 if __name__ == "__main__":
+    from generative.builder_with_director import PizzaSauceType, PizzaBase, PizzaDoughDepth, PizzaDoughType, \
+        PizzaTopLevelType
+
     # Cooking pizza Margarita
     pizza_base = PizzaBase(PizzaDoughDepth.THICK, PizzaDoughType.WHEAT)
     builder = Pizza.getBuilder()
@@ -1,5 +1,8 @@
 from __future__ import annotations
+import time
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from typing import List
 
 
 class Creator(ABC):
@@ -30,10 +33,45 @@ class Creator(ABC):
         product = self.factory_method()
 
         # Next, we are working with this product.
-        result = f"Creator: The same creator's code has just worked with {product.operation()}"
+        result = self._describe(product)
 
         return result
 
+    @staticmethod
+    def _describe(product: Product) -> str:
+        return f"Creator: The same creator's code has just worked with {product.operation()}"
+
+    def create_many(self, n: int) -> List[Product]:
+        """
+        Batch version of the factory method. Concrete creators can override it
+        with a bulk allocation that skips the per-product dispatch.
+        """
+        _check_count(n)
+        factory_method = self.factory_method
+        return [factory_method() for _ in range(n)]
+
+    def create_batch(self, n: int) -> ProductBatch:
+        """
+        A compact view of n products. Products without their own state (like
+        all products in this module) are interchangeable, so a single
+        instance stands for the whole batch.
+        """
+        _check_count(n)
+        return ProductBatch(self.factory_method(), n)
+
+    def operate_many(self, n: int) -> List[str]:
+        """
+        The same as calling `some_operation` n times.
+        """
+        _check_count(n)
+        factory_method, describe = self.factory_method, self._describe
+        return [describe(factory_method()) for _ in range(n)]
+
+
+def _check_count(n: int) -> None:
+    if n < 0:
+        raise ValueError(f"Cannot create {n} products")
+
 
 """
 Concrete Creators override the factory method in order to change the type
@@ -51,11 +89,19 @@ class ConcreteCreator1(Creator):
     def factory_method(self) -> Product:
         return ConcreteProduct1()
 
+    def create_many(self, n: int) -> List[Product]:
+        _check_count(n)
+        return [ConcreteProduct1() for _ in range(n)]
+
 
 class ConcreteCreator2(Creator):
     def factory_method(self) -> Product:
         return ConcreteProduct2()
 
+    def create_many(self, n: int) -> List[Product]:
+        _check_count(n)
+        return [ConcreteProduct2() for _ in range(n)]
+
 
 class Product(ABC):
     """
@@ -82,6 +128,28 @@ class ConcreteProduct2(Product):
         return "{Result of the ConcreteProduct2}"
 
 
+class ProductBatch(Sequence):
+    """
+    n products represented by one shared instance.
+    """
+
+    def __init__(self, product: Product, n: int) -> None:
+        self._product = product
+        self._n = n
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ProductBatch(self._product, len(range(self._n)[index]))
+        range(self._n)[index]  # raises IndexError like a list would
+        return self._product
+
+    def __len__(self) -> int:
+        return self._n
+
+    def operations(self) -> List[str]:
+        return [self._product.operation()] * self._n
+
+
 def client_code(creator: Creator) -> None:
     """
     The client code works with an instance of a specific creator, albeit through
@@ -100,3 +168,37 @@ if __name__ == "__main__":
 
     print("App: Launched with the ConcreteCreator2.")
     client_code(ConcreteCreator2())
+
+    print("\n")
+
+    n = 1_000_000
+    for creator in (ConcreteCreator1(), ConcreteCreator2()):
+        name = type(creator).__name__
+        start = time.perf_counter()
+        products = []
+        for _ in range(n):
+            products.append(creator.factory_method())
+        one_by_one = time.perf_counter() - start
+        del products
+
+        start = time.perf_counter()
+        creator.create_many(n)
+        many = time.perf_counter() - start
+
+        start = time.perf_counter()
+        creator.create_batch(n)
+        batch = time.perf_counter() - start
+
+        start = time.perf_counter()
+        results = []
+        for _ in range(n):
+            results.append(creator.some_operation())
+        operations = time.perf_counter() - start
+
+        start = time.perf_counter()
+        creator.operate_many(n)
+        operate_many = time.perf_counter() - start
+
+        print(f"{name}: factory_method x{n} {one_by_one:.3f} s, create_many {many:.3f} s, "
+              f"create_batch {batch * 1e6:.1f} us; some_operation x{n} {operations:.3f} s, "
+              f"operate_many {operate_many:.3f} s")
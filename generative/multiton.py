@@ -0,0 +1,158 @@
+"""
+A multiton is a variation of the singleton that keeps one instance per key
+instead of one per class. Here the key is the normalized set of constructor
+arguments, so the metaclass acts as an instance cache for expensive,
+parameterized objects.
+"""
+
+import inspect
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict
+
+
+def _freeze(value):
+    """
+    Turns the usual mutable containers into hashable equivalents, so that
+    `Cls([1, 2])` and `Cls([1, 2])` end up with the same key. Types are part
+    of the result, like with `lru_cache(typed=True)`: `Cls(True)` and
+    `Cls(1)`, or `Cls([1, 2])` and `Cls((1, 2))`, are different instances.
+    """
+    if isinstance(value, (list, tuple)):
+        return type(value), tuple(_freeze(it) for it in value)
+    if isinstance(value, dict):
+        return type(value), frozenset((_freeze(key), _freeze(it)) for key, it in value.items())
+    if isinstance(value, (set, frozenset)):
+        return type(value), frozenset(_freeze(it) for it in value)
+    return type(value), value
+
+
+class MultitonMeta(type):
+    """
+    Keeps at most `maxsize` instances per class in LRU order. With `ttl` set,
+    an instance older than `ttl` seconds is created again on the next call.
+
+        class Connection(metaclass=MultitonMeta, maxsize=32, ttl=60.0):
+            ...
+
+    `Connection("db", port=5432)` and `Connection(port=5432, host="db")`
+    return the same object, because arguments are bound to the constructor
+    signature and defaults are applied before building the key.
+    """
+
+    def __new__(mcs, name, bases, namespace, maxsize: int = None, ttl: float = None, **kwargs):
+        cls = super().__new__(mcs, name, bases, namespace, **kwargs)
+        cls._maxsize = maxsize if maxsize is not None else getattr(cls, "_maxsize", 128)
+        cls._ttl = ttl if ttl is not None else getattr(cls, "_ttl", None)
+        cls._cache = OrderedDict()
+        cls._cache_lock = threading.RLock()
+        # Key -> lock held while the instance for that key is being built.
+        cls._building: Dict[tuple, threading.RLock] = {}
+        cls._stats = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+        cls._signature = inspect.signature(cls.__init__)
+        return cls
+
+    def __init__(cls, name, bases, namespace, maxsize: int = None, ttl: float = None, **kwargs):
+        super().__init__(name, bases, namespace, **kwargs)
+
+    def _make_key(cls, args, kwargs):
+        bound = cls._signature.bind(None, *args, **kwargs)
+        bound.apply_defaults()
+        arguments = bound.arguments
+        arguments.pop(next(iter(cls._signature.parameters)))
+        key = tuple((name, _freeze(value)) for name, value in arguments.items())
+        hash(key)
+        return key
+
+    def _lookup(cls, key):
+        # Must be called with _cache_lock held.
+        entry = cls._cache.get(key)
+        if entry is None:
+            return None
+        instance, created = entry
+        if cls._ttl is None or time.monotonic() - created < cls._ttl:
+            cls._cache.move_to_end(key)
+            cls._stats["hits"] += 1
+            return entry
+        del cls._cache[key]
+        cls._stats["expirations"] += 1
+        return None
+
+    def __call__(cls, *args, **kwargs):
+        key = cls._make_key(args, kwargs)
+        with cls._cache_lock:
+            entry = cls._lookup(key)
+            if entry is not None:
+                return entry[0]
+            key_lock = cls._building.setdefault(key, threading.RLock())
+
+        # The instance is built holding only the lock of its key, so a slow
+        # constructor does not hold up callers asking for other keys.
+        with key_lock:
+            with cls._cache_lock:
+                entry = cls._lookup(key)
+                if entry is not None:
+                    return entry[0]
+                cls._stats["misses"] += 1
+            try:
+                instance = super().__call__(*args, **kwargs)
+            except BaseException:
+                with cls._cache_lock:
+                    cls._release_key(key, key_lock)
+                raise
+            with cls._cache_lock:
+                cls._cache[key] = (instance, time.monotonic())
+                while len(cls._cache) > cls._maxsize:
+                    cls._cache.popitem(last=False)
+                    cls._stats["evictions"] += 1
+                cls._release_key(key, key_lock)
+            return instance
+
+    def _release_key(cls, key, key_lock) -> None:
+        if cls._building.get(key) is key_lock:
+            del cls._building[key]
+
+    def cache_info(cls) -> Dict[str, int]:
+        with cls._cache_lock:
+            return dict(cls._stats, size=len(cls._cache), maxsize=cls._maxsize)
+
+    def cache_clear(cls) -> None:
+        with cls._cache_lock:
+            cls._cache.clear()
+            for name in cls._stats:
+                cls._stats[name] = 0
+
+
+class ReportRenderer(metaclass=MultitonMeta, maxsize=2):
+    """
+    An object that is expensive to set up and depends on its arguments.
+    """
+
+    def __init__(self, template: str, locale: str = "en"):
+        time.sleep(0.01)
+        self.template = template
+        self.locale = locale
+
+    def render(self, value) -> str:
+        return f"[{self.locale}] {self.template.format(value)}"
+
+
+if __name__ == "__main__":
+    r1 = ReportRenderer("Total: {}")
+    r2 = ReportRenderer(template="Total: {}", locale="en")
+    r3 = ReportRenderer("Total: {}", "de")
+
+    print(f"Same arguments give the same instance: {r1 is r2}")
+    print(f"Different arguments give a different instance: {r1 is not r3}")
+
+    ReportRenderer("Sum: {}")
+    print(f"Least recently used instance evicted: {ReportRenderer('Total: {}') is not r1}")
+    print(ReportRenderer.cache_info())
+
+    ReportRenderer.cache_clear()
+    start = time.perf_counter()
+    for i in range(1000):
+        ReportRenderer("Total: {}", ("en", "de")[i % 2]).render(i)
+    print(f"1000 renders with 2 distinct configurations: {time.perf_counter() - start:.3f} s, "
+          f"{ReportRenderer.cache_info()}")
@@ -47,7 +47,7 @@ class SomePrototype:
 
         return new
 
-    def __deepcopy__(self, memo={}):
+    def __deepcopy__(self, memo=None):
         """
         Create a deep copy. This method will be called whenever someone calls
         `copy.deepcopy` with this object and the returned value is returned as
@@ -59,17 +59,18 @@ class SomePrototype:
         you make in the `__deepcopy__` implementation to prevent infinite
         recursions.
         """
-
-        # First, let's create copies of the nested objects.
-        some_list_of_objects = copy.deepcopy(self.some_list_of_objects, memo)
-        some_circular_ref = copy.deepcopy(self.some_circular_ref, memo)
-
-        # Then, let's clone the object itself, using the prepared clones of the
-        # nested objects.
-        new = self.__class__(
-            self.some_int, some_list_of_objects, some_circular_ref
-        )
-        new.__dict__ = copy.deepcopy(self.__dict__, memo)
+        if memo is None:
+            memo = {}
+
+        # First, let's create an empty clone and remember it in the memo, so
+        # that nested objects referring back to us (like `some_circular_ref`)
+        # get this clone instead of creating another one.
+        new = self.__class__.__new__(self.__class__)
+        memo[id(self)] = new
+
+        # Then, let's copy the state once: `__dict__` already contains
+        # `some_list_of_objects` and `some_circular_ref`.
+        new.__dict__.update(copy.deepcopy(self.__dict__, memo))
 
         return new
 
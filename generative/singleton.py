@@ -3,15 +3,67 @@ A singleton is a generative design pattern that ensures that a
 class has only one instance and provides a global access point to it.
 """
 
+import os
+import threading
+import time
+
 
 class SingletonMeta(type):
+    """
+    Thread-safe singleton metaclass.
+
+    Reading an already created instance does not take any lock. Only the first
+    creation goes through double-checked locking, and every class has its own
+    lock, so slow constructors of different singletons do not wait for each
+    other.
+
+    Classes declared with `reset_after_fork=True` lose their instance in a
+    child process after `os.fork()`, so things like connections are created
+    again instead of being shared with the parent.
+    """
     _instances = {}
+    _locks = {}
+    _locks_guard = threading.Lock()
+
+    def __new__(mcs, name, bases, namespace, reset_after_fork: bool = False, **kwargs):
+        cls = super().__new__(mcs, name, bases, namespace, **kwargs)
+        if reset_after_fork:
+            cls._reset_after_fork = True
+        return cls
+
+    def __init__(cls, name, bases, namespace, reset_after_fork: bool = False, **kwargs):
+        super().__init__(name, bases, namespace, **kwargs)
 
     def __call__(cls, *args, **kwargs):
-        if cls not in cls._instances:
-            instance = super().__call__(*args, **kwargs)
-            cls._instances[cls] = instance
-        return cls._instances[cls]
+        instance = cls._instances.get(cls)
+        if instance is not None:
+            return instance
+        with cls._class_lock():
+            instance = cls._instances.get(cls)
+            if instance is None:
+                instance = super().__call__(*args, **kwargs)
+                cls._instances[cls] = instance
+        return instance
+
+    def _class_lock(cls) -> threading.Lock:
+        lock = SingletonMeta._locks.get(cls)
+        if lock is None:
+            with SingletonMeta._locks_guard:
+                lock = SingletonMeta._locks.setdefault(cls, threading.Lock())
+        return lock
+
+    @staticmethod
+    def _after_fork_in_child() -> None:
+        # Locks may have been held by threads that do not exist in the child.
+        SingletonMeta._locks_guard = threading.Lock()
+        SingletonMeta._locks = {}
+        for cls in list(SingletonMeta._instances):
+            if getattr(cls, "_reset_after_fork", False):
+                del SingletonMeta._instances[cls]
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=SingletonMeta._after_fork_in_child)
 
 
 class Singleton(metaclass=SingletonMeta):
@@ -24,6 +76,39 @@ class Singleton(metaclass=SingletonMeta):
         return True
 
 
+class ExpensiveConnection(metaclass=SingletonMeta, reset_after_fork=True):
+    """
+    A singleton with a slow constructor that must not be shared between processes.
+    """
+    created = 0
+
+    def __init__(self):
+        time.sleep(0.05)
+        ExpensiveConnection.created += 1
+        self.pid = os.getpid()
+
+
+def contention_benchmark(threads: int = 64, calls: int = 10_000) -> None:
+    barrier = threading.Barrier(threads)
+
+    def worker():
+        barrier.wait()
+        for _ in range(calls):
+            ExpensiveConnection()
+
+    pool = [threading.Thread(target=worker) for _ in range(threads)]
+    start = time.perf_counter()
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    print(f"{threads} threads x {calls} calls: {elapsed:.3f} s, "
+          f"{threads * calls / elapsed:,.0f} calls/s, "
+          f"constructor ran {ExpensiveConnection.created} time(s)")
+
+
 if __name__ == "__main__":
     s1 = Singleton('Test 1')
     s2 = Singleton('Test 2')
@@ -35,3 +120,15 @@ if __name__ == "__main__":
 
     s1.some_business_logic()
     s2.some_business_logic()
+
+    contention_benchmark()
+
+    if hasattr(os, "fork"):
+        parent_connection = ExpensiveConnection()
+        pid = os.fork()
+        if pid == 0:
+            child_connection = ExpensiveConnection()
+            print(f"Child got a fresh connection: {child_connection is not parent_connection}, "
+                  f"owned by the child: {child_connection.pid == os.getpid()}")
+            os._exit(0)
+        os.waitpid(pid, 0)
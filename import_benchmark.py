@@ -0,0 +1,139 @@
+"""
+Startup benchmark: import cost of every package and pattern module.
+
+Each module is imported in a fresh interpreter with `python -X importtime`,
+and the cumulative time of the module itself is taken as its import cost (the
+best of several runs, to keep the noise down). The results are compared with
+a baseline file and modules that got noticeably slower are reported as
+regressions, with the exit status set accordingly. The baseline depends on
+the machine and is not part of the repository: record it with `--update`
+first, a run without a baseline (or for modules missing from it) never flags
+anything.
+
+    python import_benchmark.py --update     # record the baseline
+    python import_benchmark.py              # compare against it
+    python import_benchmark.py generative   # only some modules
+"""
+
+import argparse
+import json
+import os
+import pkgutil
+import subprocess
+import sys
+from typing import Dict, List
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+PACKAGES = ("generative", "behavioral", "structural")
+# Top-level modules of the repository that the packages import.
+HELPERS = ("lazy_exports",)
+DEFAULT_BASELINE = os.path.join(ROOT, ".import_baseline.json")
+
+
+def discover_modules() -> List[str]:
+    """
+    The packages and all their modules, found without importing any of them.
+    """
+    modules = []
+    for package in PACKAGES:
+        modules.append(package)
+        modules.extend(f"{package}.{info.name}" for info in pkgutil.iter_modules([os.path.join(ROOT, package)]))
+    return modules
+
+
+def parse_importtime(stderr: str) -> Dict[str, Dict[str, int]]:
+    """
+    Self and cumulative time in microseconds of every module in the output of
+    `-X importtime`.
+    """
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # the header line
+        times[fields[2].strip()] = {"self": int(fields[0]), "cumulative": int(fields[1])}
+    return times
+
+
+def measure(module: str, repeat: int = 5) -> Dict[str, int]:
+    """
+    Import cost of `module` in microseconds: its cumulative time and the part
+    of it spent in the modules of this repository.
+    """
+    best = None
+    for _ in range(repeat):
+        result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                                cwd=ROOT, capture_output=True, text=True)
+        if result.returncode != 0:
+            raise RuntimeError(f"Importing {module} failed:\n{result.stderr}")
+        times = parse_importtime(result.stderr)
+        sample = {
+            "cumulative": times[module]["cumulative"],
+            "own": sum(it["self"] for name, it in times.items() if name.split(".")[0] in PACKAGES + HELPERS),
+        }
+        if best is None or sample["cumulative"] < best["cumulative"]:
+            best = sample
+    return best
+
+
+def find_regressions(current: Dict[str, Dict[str, int]], baseline: Dict[str, Dict[str, int]],
+                     threshold: float, floor: int) -> List[str]:
+    """
+    Modules whose cumulative import time grew by more than `threshold` times
+    and by more than `floor` microseconds, so that tiny modules do not trip
+    on noise.
+    """
+    regressions = []
+    for module, sample in current.items():
+        previous = baseline.get(module)
+        if previous is None:
+            continue
+        before, after = previous["cumulative"], sample["cumulative"]
+        if after > before * threshold and after - before > floor:
+            regressions.append(module)
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("modules", nargs="*", help="modules to measure (default: all)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline file")
+    parser.add_argument("--update", action="store_true", help="write the results to the baseline file")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per module, the best one counts")
+    parser.add_argument("--threshold", type=float, default=1.5, help="slowdown factor that counts as a regression")
+    parser.add_argument("--floor", type=int, default=1000, help="ignore slowdowns below this many microseconds")
+    args = parser.parse_args(argv)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+
+    current = {module: measure(module, args.repeat) for module in args.modules or discover_modules()}
+    regressions = find_regressions(current, baseline, args.threshold, args.floor)
+
+    print(f"{'module':<45} {'cumulative':>11} {'own code':>9} {'baseline':>9}")
+    for module, sample in current.items():
+        previous = baseline.get(module, {}).get("cumulative")
+        mark = "  REGRESSION" if module in regressions else ""
+        print(f"{module:<45} {sample['cumulative']:>9}us {sample['own']:>7}us "
+              f"{'-' if previous is None else f'{previous}us':>9}{mark}")
+
+    if args.update:
+        baseline.update(current)
+        with open(args.baseline, "w") as file:
+            json.dump(baseline, file, indent=2, sort_keys=True)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+    if not baseline:
+        print(f"No baseline in {args.baseline}, nothing to compare with; record one with --update")
+    if regressions:
+        print(f"{len(regressions)} import time regressions: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
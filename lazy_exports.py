@@ -0,0 +1,33 @@
+"""
+Lazy public names for the pattern packages.
+
+Each package lists its public names and the submodules defining them; the
+module-level `__getattr__` and `__dir__` built here import a submodule only
+when one of its names is first accessed, so importing the package itself
+stays nearly free.
+"""
+
+import sys
+
+
+def lazy_attributes(package: str, exports: dict):
+    """
+    Returns `__getattr__` and `__dir__` for the package named `package`,
+    resolving the names of `exports` (name -> submodule) on first access.
+    """
+    namespace = sys.modules[package].__dict__
+
+    def __getattr__(name):
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        # __import__ rather than importlib, which would add its own import to the first lookup.
+        __import__(f"{package}.{module}")
+        value = getattr(sys.modules[f"{package}.{module}"], name)
+        namespace[name] = value
+        return value
+
+    def __dir__():
+        return sorted(set(namespace) | set(exports))
+
+    return __getattr__, __dir__
@@ -0,0 +1,50 @@
+"""
+Structural design patterns.
+
+Public classes are available from the package itself, but are imported lazily:
+`import structural` loads none of the pattern modules.
+"""
+
+from lazy_exports import lazy_attributes
+
+# Public name -> module of this package that defines it.
+_EXPORTS = {
+    "IOven": "adapter",
+    "ICelsiusOven": "adapter",
+    "OriginalOven": "adapter",
+    "OvenAdapter": "adapter",
+    "OvenFleet": "adapter_fleet",
+    "FleetOven": "adapter_fleet",
+    "FleetOvenAdapter": "adapter_fleet",
+    "StreamingOvenAdapter": "adapter_stream",
+    "AdapterSpec": "adapter_generator",
+    "LinearConversion": "adapter_generator",
+    "make_adapter": "adapter_generator",
+    "GeneratedOvenAdapter": "adapter_generator",
+    "Windows": "adapter_stream",
+    "Abstraction": "bridge",
+    "ExtendedAbstraction": "bridge",
+    "Implementation": "bridge",
+    "ConcreteImplementationA": "bridge",
+    "ConcreteImplementationB": "bridge",
+    "IClock": "bridge_example",
+    "RealClock": "bridge_example",
+    "IOvenImplementor": "bridge_example",
+    "ClassicOvenImplementor": "bridge_example",
+    "ElectricalOvenImplementor": "bridge_example",
+    "Oven": "bridge_example",
+    "VirtualClock": "bridge_simulation",
+    "KitchenSimulator": "bridge_simulation",
+    "KitchenReport": "bridge_simulation",
+    "OvenReport": "bridge_simulation",
+    "Component": "composite",
+    "Leaf": "composite",
+    "Composite": "composite",
+    "Facade": "facade",
+    "Subsystem1": "facade",
+    "Subsystem2": "facade",
+}
+
+__all__ = sorted(_EXPORTS)
+
+__getattr__, __dir__ = lazy_attributes(__name__, _EXPORTS)
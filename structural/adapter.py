@@ -19,6 +19,13 @@ class IOven(ABC):
     def set_temperature(self, t: float) -> None:
         pass
 
+    def get_version(self) -> int | None:
+        """
+        A number that changes whenever the temperature changes, or None if
+        the oven does not track its changes
+        """
+        return None
+
 
 class ICelsiusOven(ABC):
     """
@@ -44,21 +51,38 @@ class OriginalOven(IOven):
     """
     def __init__(self, t: float):
         assert t >= 32, "We are not selling a refrigerator here"
+        self._version = 0
         self.temperature = t
 
+    @property
+    def temperature(self) -> float:
+        return self._temperature
+
+    @temperature.setter
+    def temperature(self, t: float) -> None:
+        # Direct assignments change the version too, so adapters notice them
+        self._temperature = t
+        self._version += 1
+
     def set_temperature(self, t: float) -> None:
         assert t >= 32, "An oven that can freeze? HM... " \
                         "interesting"
         self.temperature = t
 
     def get_temperature(self) -> float:
-        return self.temperature
+        return self._temperature
+
+    def get_version(self) -> int | None:
+        return self._version
 
 
 class OvenAdapter(ICelsiusOven):
     """
     An adapter that allows you to work with a stove where
-    unit of measure for temperature in fahrenheit degrees celsius
+    unit of measure for temperature in fahrenheit degrees celsius.
+    The converted temperature is cached together with the version of the
+    stove it was computed from and recomputed only when the version changed
+    (on every read for stoves without versions)
     """
     CELSIUS_TO_FAHRENHEIT: float = 9.0/5.0
     FAHRENHEIT_TO_CELSIUS: float = 5.0/9.0
@@ -66,6 +90,7 @@ class OvenAdapter(ICelsiusOven):
 
     def __init__(self, original_stove: IOven):
         self.stove = original_stove
+        self._version = self.stove.get_version()
         self.temperature = self._init_temperature()
 
     def get_original_temperature(self) -> float:
@@ -75,15 +100,24 @@ class OvenAdapter(ICelsiusOven):
         return OvenAdapter.FAHRENHEIT_TO_CELSIUS * (self.stove.get_temperature() - OvenAdapter.FAHRENHEIT_ZERO)
 
     def get_celsius_temperature(self) -> float:
+        version = self.stove.get_version()
+        if version is None or version != self._version:
+            # The version is read before the temperature: a change in between
+            # leaves an old version in the cache and is picked up next time
+            self._version = version
+            self.temperature = self._init_temperature()
         return self.temperature
 
     def set_celsius_temperature(self, t: float) -> None:
         new_temperature_stove = OvenAdapter.CELSIUS_TO_FAHRENHEIT * t + OvenAdapter.FAHRENHEIT_ZERO
         self.stove.set_temperature(new_temperature_stove)
+        self._version = self.stove.get_version()
         self.temperature = t
 
 
 if __name__ == "__main__":
+    import time
+
     def print_temperature(stove: ICelsiusOven):
         print(f"Original temperature = {stove.get_original_temperature()} F")
         print(f"Celsius temperature = {stove.get_celsius_temperature()}")
@@ -96,3 +130,24 @@ if __name__ == "__main__":
     print("New temperature")
     print("----------------")
     print_temperature(celsius_stove)
+
+    print("----------------")
+    print("Changed behind the adapter's back")
+    print("----------------")
+    fahrenheit_stove.set_temperature(212)
+    print_temperature(celsius_stove)
+    fahrenheit_stove.temperature = 392
+    print_temperature(celsius_stove)
+
+    reads = 1_000_000
+    start = time.perf_counter()
+    for _ in range(reads):
+        celsius_stove.get_celsius_temperature()
+    cached = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(reads):
+        celsius_stove._init_temperature()
+    recomputed = time.perf_counter() - start
+    print("----------------")
+    print(f"{reads} reads: version-checked cache {cached * 1000:.0f} ms, "
+          f"recomputing every time {recomputed * 1000:.0f} ms")
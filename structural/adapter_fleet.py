@@ -0,0 +1,172 @@
+"""
+Adapter for a whole fleet of ovens at once.
+
+OvenAdapter converts the temperature of one OriginalOven per call with Python
+float math. The fleet keeps the Fahrenheit temperatures of all its ovens in a
+NumPy array, and the fleet adapter converts and validates them with whole-array
+operations using the same constants as OvenAdapter. A single oven of the fleet
+is still available as an IOven, so it can be wrapped by the usual OvenAdapter.
+"""
+
+import time
+from typing import Iterable, Optional
+
+import numpy as np
+
+from structural.adapter import IOven, OriginalOven, OvenAdapter
+
+
+def _check_fahrenheit(t: np.ndarray, count: Optional[int] = None, index=None) -> None:
+    # The same rule as OriginalOven.set_temperature, checked for every oven at once.
+    if (t >= OvenAdapter.FAHRENHEIT_ZERO).all():
+        return
+    invalid = np.flatnonzero(~(t >= OvenAdapter.FAHRENHEIT_ZERO))
+    # With an index the oven numbers are only worked out here, on the error path.
+    first = invalid[0] if index is None else np.atleast_1d(np.arange(count)[index])[invalid[0]]
+    raise AssertionError(f"An oven that can freeze? {invalid.size} ovens, the first one is #{first}")
+
+
+class OvenFleet:
+    """
+    Fahrenheit temperatures of many ovens (the adaptee side of the fleet).
+    """
+
+    def __init__(self, temperatures: Iterable[float]):
+        t = np.array(temperatures, dtype=np.float64)
+        if t.ndim != 1:
+            raise ValueError("Temperatures must be a flat sequence")
+        _check_fahrenheit(t)
+        self._temperatures = t
+        # One version for the whole fleet: any update invalidates the
+        # cached reads of every OvenAdapter on a FleetOven.
+        self.version = 0
+
+    @classmethod
+    def from_ovens(cls, ovens: Iterable[IOven]) -> "OvenFleet":
+        return cls(np.fromiter((oven.get_temperature() for oven in ovens), dtype=np.float64))
+
+    def __len__(self) -> int:
+        return len(self._temperatures)
+
+    def get_temperatures(self) -> np.ndarray:
+        """
+        A read-only view of the temperatures, valid until the next update.
+        """
+        view = self._temperatures.view()
+        view.flags.writeable = False
+        return view
+
+    def set_temperatures(self, t, index=None) -> None:
+        """
+        Sets the temperature of all ovens, or of those selected by `index`
+        (anything NumPy accepts as an index). Nothing changes if any of the
+        new temperatures is invalid.
+        """
+        t = np.asarray(t, dtype=np.float64)
+        if index is None:
+            _check_fahrenheit(t)
+            self._temperatures[:] = t
+            self.version += 1
+        else:
+            _check_fahrenheit(np.broadcast_to(t, self._temperatures[index].shape), len(self._temperatures), index)
+            self._temperatures[index] = t
+            self.version += 1
+
+    def oven(self, i: int) -> "FleetOven":
+        return FleetOven(self, i)
+
+
+class FleetOven(IOven):
+    """
+    One oven of a fleet behind the IOven interface.
+    """
+
+    def __init__(self, fleet: OvenFleet, i: int):
+        self._fleet = fleet
+        self._i = i
+
+    def get_temperature(self) -> float:
+        return float(self._fleet._temperatures[self._i])
+
+    def set_temperature(self, t: float) -> None:
+        assert t >= 32, "An oven that can freeze? HM... " \
+                        "interesting"
+        self._fleet._temperatures[self._i] = t
+        self._fleet.version += 1
+
+    def get_version(self) -> int:
+        return self._fleet.version
+
+
+class FleetOvenAdapter:
+    """
+    The ICelsiusOven of a fleet: every call handles all ovens (or the ovens
+    selected by `index`) with vectorized conversion.
+    """
+
+    def __init__(self, fleet: OvenFleet):
+        self.fleet = fleet
+
+    def __len__(self) -> int:
+        return len(self.fleet)
+
+    def get_original_temperatures(self) -> np.ndarray:
+        return self.fleet.get_temperatures()
+
+    def get_celsius_temperatures(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Celsius temperatures of all ovens; pass `out` to reuse an array
+        between calls instead of allocating a new one.
+        """
+        out = np.subtract(self.fleet.get_temperatures(), OvenAdapter.FAHRENHEIT_ZERO, out=out)
+        return np.multiply(out, OvenAdapter.FAHRENHEIT_TO_CELSIUS, out=out)
+
+    def set_celsius_temperatures(self, t, index=None) -> None:
+        t = np.multiply(t, OvenAdapter.CELSIUS_TO_FAHRENHEIT, dtype=np.float64)
+        t += OvenAdapter.FAHRENHEIT_ZERO
+        self.fleet.set_temperatures(t, index)
+
+    def adapter(self, i: int) -> OvenAdapter:
+        """
+        A classic adapter for one oven of the fleet.
+        """
+        return OvenAdapter(self.fleet.oven(i))
+
+
+if __name__ == "__main__":
+    count = 1_000_000
+    rng = np.random.default_rng(0)
+    fahrenheit = rng.uniform(32, 500, count)
+    celsius = rng.uniform(0, 260, count)
+
+    adapters = [OvenAdapter(OriginalOven(float(t))) for t in fahrenheit]
+    start = time.perf_counter()
+    loop_read = [adapter.get_celsius_temperature() for adapter in adapters]
+    read_time = time.perf_counter() - start
+    start = time.perf_counter()
+    for adapter, t in zip(adapters, celsius.tolist()):
+        adapter.set_celsius_temperature(t)
+    write_time = time.perf_counter() - start
+
+    fleet = FleetOvenAdapter(OvenFleet(fahrenheit))
+    out = np.empty(count)
+    start = time.perf_counter()
+    fleet.get_celsius_temperatures(out)
+    fleet_read_time = time.perf_counter() - start
+    start = time.perf_counter()
+    fleet.set_celsius_temperatures(celsius)
+    fleet_write_time = time.perf_counter() - start
+
+    print(f"Same readings: {np.allclose(out, loop_read)}")
+    print(f"Same ovens after the update: "
+          f"{np.allclose(fleet.get_original_temperatures(), [a.get_original_temperature() for a in adapters])}")
+    single = fleet.adapter(42)
+    single.set_celsius_temperature(180)
+    print(f"Oven #42 through OvenAdapter: {fleet.get_original_temperatures()[42]} F")
+    try:
+        fleet.set_celsius_temperatures([100, -5, 20], index=[1, 2, 3])
+    except AssertionError as e:
+        print(f"Rejected: {e}")
+    print('---------------------------')
+    print(f"{count} ovens, read:  adapters {read_time * 1000:.1f} ms, fleet {fleet_read_time * 1000:.1f} ms")
+    print(f"{count} ovens, write: adapters {write_time * 1000:.1f} ms, fleet {fleet_write_time * 1000:.1f} ms")
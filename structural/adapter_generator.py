@@ -0,0 +1,200 @@
+"""
+Adapters generated from declarative unit-conversion specs.
+
+Interfaces like IOven / ICelsiusOven differ only in the unit of the values
+passing through them, and a handwritten adapter like OvenAdapter evaluates
+the same chain of class attribute lookups and arithmetic on every call. An
+AdapterSpec describes such a pair of interfaces: which target methods read,
+write or pass through which source methods, the linear conversion between
+the units and the valid range of source values. `make_adapter` generates the
+source of the adapter class once, with the conversion constants folded into
+the methods.
+With a `version` method in the spec the getters cache the converted value
+like OvenAdapter does and convert again only when the version changed.
+
+Out-of-range writes are rejected by the adapter itself with a ValueError
+before the adaptee is called, so they are rejected under `python -O` as
+well; a handwritten OvenAdapter passes them on and gets the adaptee's
+AssertionError (or nothing at all with -O).
+"""
+
+import math
+import time
+from fractions import Fraction
+from numbers import Real
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from structural.adapter import ICelsiusOven, IOven, OriginalOven, OvenAdapter
+
+
+class LinearConversion(NamedTuple):
+    """
+    target = source * scale + offset. Exact numbers (ints, Fractions) keep
+    the inverse conversion exact, they are rounded to floats only when the
+    constants are folded into the adapter.
+    """
+    scale: Real
+    offset: Real = 0
+
+    @classmethod
+    def shifted(cls, zero: Real, factor: Real) -> "LinearConversion":
+        """
+        target = (source - zero) * factor, like Fahrenheit to Celsius
+        """
+        return cls(factor, -zero * factor)
+
+    def inverse(self) -> "LinearConversion":
+        scale = Fraction(self.scale) if isinstance(self.scale, int) else self.scale
+        return LinearConversion(1 / scale, -self.offset / scale)
+
+
+class AdapterSpec(NamedTuple):
+    """
+    `getters` and `setters` map target methods to the source methods they
+    convert, `passthrough` maps target methods to source methods returning
+    the raw value. Values written to the source must lie within `bounds`
+    (None - no limit on that side). `version` is the source method returning
+    a number that changes with the source's values (None if the source does
+    not track its changes); without it the getters convert on every call.
+    """
+    name: str
+    source: type
+    target: type
+    conversion: LinearConversion
+    getters: Dict[str, str]
+    setters: Dict[str, str] = {}
+    passthrough: Dict[str, str] = {}
+    bounds: Tuple[Optional[Real], Optional[Real]] = (None, None)
+    version: Optional[str] = None
+
+
+def _linear(expression: str, conversion: LinearConversion) -> str:
+    # repr() keeps every bit of a float, so the folded constants are exact.
+    code = expression if conversion.scale == 1 else f"{expression} * {float(conversion.scale)!r}"
+    if conversion.offset == 0:
+        return code
+    return f"{code} {'-' if conversion.offset < 0 else '+'} {abs(float(conversion.offset))!r}"
+
+
+def adapter_source(spec: AdapterSpec) -> str:
+    """
+    The Python source of the adapter class described by `spec`.
+    """
+    source_methods = sorted({*spec.getters.values(), *spec.setters.values(), *spec.passthrough.values(),
+                             *([spec.version] if spec.version else [])})
+    for method in source_methods:
+        if not callable(getattr(spec.source, method, None)):
+            raise TypeError(f"{spec.source.__name__} has no method {method!r}")
+    # Called through the adaptee rather than bound once in __init__: since
+    # Python 3.11 `obj.method()` skips creating the bound method, calling a
+    # stored bound method is slower.
+    call = {method: f"self.adaptee.{method}()" for method in source_methods}
+
+    lines = [f"class {spec.name}(_target):",
+             "    def __init__(self, adaptee):",
+             "        self.adaptee = adaptee"]
+    # Every getter caches its value with the version it was converted at,
+    # None (never equal to a tracked version) means "convert on next read".
+    if spec.version:
+        lines += [f"        self._{target}_version = None" for target in spec.getters]
+
+    for target, method in spec.getters.items():
+        value = _linear(call[method], spec.conversion)
+        if not spec.version:
+            lines += ["", f"    def {target}(self):",
+                      f"        return {value}"]
+            continue
+        lines += ["", f"    def {target}(self):",
+                  f"        version = {call[spec.version]}",
+                  f"        if version is None or version != self._{target}_version:",
+                  f"            self._{target}_version = version",
+                  f"            self._{target}_value = {value}",
+                  f"        return self._{target}_value"]
+    for target, method in spec.passthrough.items():
+        lines += ["", f"    def {target}(self):",
+                  f"        return {call[method]}"]
+
+    low, high = spec.bounds
+    chain = ["value"]
+    if low is not None:
+        chain.insert(0, repr(float(low)))
+    if high is not None:
+        chain.append(repr(float(high)))
+    for target, method in spec.setters.items():
+        lines += ["", f"    def {target}(self, value):",
+                  f"        value = {_linear('value', spec.conversion.inverse())}"]
+        if len(chain) > 1:
+            # Written as "not in range" so that NaN is rejected as well.
+            lines += [f"        if not ({' <= '.join(chain)}):",
+                      f"            raise ValueError(f'{spec.source.__name__} value {{value!r}} is out of range "
+                      f"{' <= '.join(chain).replace('value', 'x')}')"]
+        lines += [f"        {call[method][:-1]}value)"]
+        lines += [f"        self._{it}_version = None" for it in (spec.getters if spec.version else ())]
+    return "\n".join(lines) + "\n"
+
+
+def make_adapter(spec: AdapterSpec) -> type:
+    """
+    Generates and compiles the adapter class; call it once per spec and keep
+    the class.
+    """
+    source = adapter_source(spec)
+    namespace = {"_target": spec.target}
+    exec(compile(source, f"<adapter {spec.name}>", "exec"), namespace)
+    adapter = namespace[spec.name]
+    if adapter.__abstractmethods__:
+        raise TypeError(f"{spec.name} does not implement {', '.join(sorted(adapter.__abstractmethods__))}")
+    adapter.__module__ = __name__
+    adapter.source = source
+    return adapter
+
+
+OVEN_SPEC = AdapterSpec(
+    name="GeneratedOvenAdapter",
+    source=IOven,
+    target=ICelsiusOven,
+    conversion=LinearConversion.shifted(32, Fraction(5, 9)),  # the exact OvenAdapter constants
+    getters={"get_celsius_temperature": "get_temperature"},
+    setters={"set_celsius_temperature": "set_temperature"},
+    passthrough={"get_original_temperature": "get_temperature"},
+    bounds=(OvenAdapter.FAHRENHEIT_ZERO, None),
+    version="get_version",
+)
+
+GeneratedOvenAdapter = make_adapter(OVEN_SPEC)
+
+
+def _measure(adapter: ICelsiusOven, calls: int, repeat: int = 5) -> Tuple[float, float]:
+    reads = writes = math.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(calls):
+            adapter.get_celsius_temperature()
+        reads = min(reads, time.perf_counter() - start)
+        start = time.perf_counter()
+        for i in range(calls):
+            adapter.set_celsius_temperature(i & 255)
+        writes = min(writes, time.perf_counter() - start)
+    return reads, writes
+
+
+if __name__ == "__main__":
+    print(GeneratedOvenAdapter.source)
+    handwritten, generated = OvenAdapter(OriginalOven(32)), GeneratedOvenAdapter(OriginalOven(32))
+    for t in (0, 37.5, 180, 250):
+        handwritten.set_celsius_temperature(t)
+        generated.set_celsius_temperature(t)
+        assert math.isclose(handwritten.get_original_temperature(), generated.get_original_temperature())
+        assert math.isclose(handwritten.get_celsius_temperature(), generated.get_celsius_temperature())
+    print(f"Same temperatures, e.g. {generated.get_original_temperature()} F = "
+          f"{generated.get_celsius_temperature()} C")
+    try:
+        generated.set_celsius_temperature(-40)
+    except ValueError as e:
+        print(f"Rejected: {e}")
+    print('---------------------------')
+
+    calls = 1_000_000
+    for name, adapter in (("OvenAdapter", handwritten), ("generated", generated)):
+        reads, writes = _measure(adapter, calls)
+        print(f"{name:<12} {calls} reads {reads * 1000:.0f} ms, {calls} writes {writes * 1000:.0f} ms")
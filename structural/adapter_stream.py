@@ -0,0 +1,184 @@
+"""
+Streaming adapter for continuous oven sensor readings.
+
+OvenAdapter converts a single temperature per call. Sensors emit an endless
+stream of Fahrenheit readings, so the streaming adapter converts them batch by
+batch with the OvenAdapter constants, optionally keeps only every n-th reading
+and aggregates fixed-size windows into min / max / mean. Only the current
+batch and the unfinished window are kept in memory, whatever the length of
+the stream. Synchronous and asynchronous sources are supported, either as
+single readings or as ready-made batches (arrays), the fastest way to feed it.
+"""
+
+import asyncio
+import itertools
+import time
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator, NamedTuple, Optional, Union
+
+import numpy as np
+
+from structural.adapter import OriginalOven, OvenAdapter
+
+
+class Windows(NamedTuple):
+    """
+    Aggregates of consecutive windows of Celsius readings. All windows have
+    `size` readings except the last one of a stream, which may be shorter.
+    """
+    minimum: np.ndarray
+    maximum: np.ndarray
+    mean: np.ndarray
+    size: int
+
+
+class StreamingOvenAdapter:
+
+    def __init__(self, window: Optional[int] = None, downsample: int = 1, batch_size: int = 65536):
+        """
+        `downsample=n` keeps every n-th reading (counting from the first one
+        of the stream); windows are aggregated over the kept readings. Single
+        readings are grouped into batches of `batch_size`.
+        """
+        if window is not None and window < 1:
+            raise ValueError("Window must be positive")
+        if downsample < 1 or batch_size < 1:
+            raise ValueError("Downsampling step and batch size must be positive")
+        self.window = window
+        self.downsample = downsample
+        self.batch_size = batch_size
+        self.reset()
+
+    def reset(self) -> None:
+        self._seen = 0
+        self._pending = np.empty(0)
+
+    def feed(self, fahrenheit) -> Union[np.ndarray, Windows]:
+        """
+        Processes the next batch of readings: returns the Celsius readings,
+        or the windows completed by this batch when windows are enabled.
+        """
+        celsius = np.subtract(fahrenheit, OvenAdapter.FAHRENHEIT_ZERO, dtype=np.float64)
+        celsius *= OvenAdapter.FAHRENHEIT_TO_CELSIUS
+        if self.downsample > 1:
+            first = -self._seen % self.downsample
+            self._seen += len(celsius)
+            celsius = celsius[first::self.downsample]
+        if self.window is None:
+            return celsius
+
+        if len(self._pending):
+            celsius = np.concatenate((self._pending, celsius))
+        complete = len(celsius) - len(celsius) % self.window
+        self._pending = celsius[complete:].copy()
+        windows = celsius[:complete].reshape(-1, self.window)
+        return Windows(windows.min(axis=1), windows.max(axis=1), windows.mean(axis=1), self.window)
+
+    def flush(self) -> Optional[Windows]:
+        """
+        The unfinished window at the end of a stream, if there is one.
+        """
+        if self.window is None or not len(self._pending):
+            return None
+        pending, self._pending = self._pending, np.empty(0)
+        return Windows(pending.min(keepdims=True), pending.max(keepdims=True), pending.mean(keepdims=True),
+                       len(pending))
+
+    def _results(self, batches: Iterable) -> Iterator[Union[np.ndarray, Windows]]:
+        for batch in batches:
+            result = self.feed(batch)
+            if len(result[0] if self.window else result):
+                yield result
+        tail = self.flush()
+        if tail is not None:
+            yield tail
+
+    def stream_batches(self, batches: Iterable) -> Iterator[Union[np.ndarray, Windows]]:
+        self.reset()
+        return self._results(batches)
+
+    def stream(self, readings: Iterable[float]) -> Iterator[Union[np.ndarray, Windows]]:
+        def batched():
+            iterator = iter(readings)
+            while True:
+                batch = np.fromiter(itertools.islice(iterator, self.batch_size), dtype=np.float64)
+                if not len(batch):
+                    return
+                yield batch
+
+        return self.stream_batches(batched())
+
+    async def astream_batches(self, batches: AsyncIterable) -> AsyncIterator[Union[np.ndarray, Windows]]:
+        self.reset()
+        async for batch in batches:
+            result = self.feed(batch)
+            if len(result[0] if self.window else result):
+                yield result
+        tail = self.flush()
+        if tail is not None:
+            yield tail
+
+    async def astream(self, readings: AsyncIterable[float]) -> AsyncIterator[Union[np.ndarray, Windows]]:
+        async def batched():
+            batch = []
+            async for reading in readings:
+                batch.append(reading)
+                if len(batch) == self.batch_size:
+                    yield batch
+                    batch = []
+            if batch:
+                yield batch
+
+        async for result in self.astream_batches(batched()):
+            yield result
+
+
+def _sensor(count: int, seed: int = 0) -> Iterator[np.ndarray]:
+    rng = np.random.default_rng(seed)
+    for _ in range(count // 1_000_000):
+        yield 400 + rng.normal(0, 5, 1_000_000)
+
+
+async def _async_sensor(count: int) -> AsyncIterator[float]:
+    for batch in _sensor(count, seed=1):
+        await asyncio.sleep(0)  # waiting for the next packet
+        for reading in batch.tolist():
+            yield reading
+
+
+async def _async_demo(count: int) -> float:
+    start = time.perf_counter()
+    async for _ in StreamingOvenAdapter(window=1000).astream(_async_sensor(count)):
+        pass
+    return count / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    adapter = StreamingOvenAdapter(window=4, downsample=2)
+    for result in adapter.stream([32, 50, 212, 50, 392, 50, 212, 50, 32, 50, 212]):
+        print(result)
+    print('---------------------------')
+
+    count = 20_000_000
+    start = time.perf_counter()
+    windows = sum(len(it.mean) for it in StreamingOvenAdapter(window=1000).stream_batches(_sensor(count)))
+    batched = count / (time.perf_counter() - start)
+
+    readings = itertools.chain.from_iterable(batch.tolist() for batch in _sensor(2_000_000))
+    start = time.perf_counter()
+    for _ in StreamingOvenAdapter(window=1000, downsample=10).stream(readings):
+        pass
+    single = 2_000_000 / (time.perf_counter() - start)
+
+    oven = OriginalOven(32)
+    celsius_oven = OvenAdapter(oven)
+    values = next(_sensor(1_000_000)).tolist()
+    start = time.perf_counter()
+    for value in values:
+        oven.set_temperature(value)
+        celsius_oven.get_celsius_temperature()
+    per_call = len(values) / (time.perf_counter() - start)
+
+    print(f"Array batches:           {batched:>13,.0f} readings/s ({windows} windows)")
+    print(f"Single readings:         {single:>13,.0f} readings/s")
+    print(f"Single readings (async): {asyncio.run(_async_demo(2_000_000)):>13,.0f} readings/s")
+    print(f"OvenAdapter per reading: {per_call:>13,.0f} readings/s")
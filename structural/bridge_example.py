@@ -22,6 +22,29 @@ class Pizza:
         return self.__isCook
 
 
+class IClock(ABC):
+    """ Source of time for the ovens, so that they can also run in virtual time """
+    @abstractmethod
+    def now(self) -> float:
+        pass
+
+    @abstractmethod
+    def sleep(self, seconds: float) -> None:
+        pass
+
+
+class RealClock(IClock):
+
+    def now(self) -> float:
+        return time.monotonic()
+
+    def sleep(self, seconds: float) -> None:
+        time.sleep(seconds)
+
+
+REAL_CLOCK = RealClock()
+
+
 class IOvenImplementor(ABC):
     """ Interface for the implementation of furnaces of various types """
     @abstractmethod
@@ -47,24 +70,25 @@ class IOvenImplementor(ABC):
 
 class ClassicOvenImplementor(IOvenImplementor):
 
-    def __init__(self, temperature: int = 0):
+    def __init__(self, temperature: int = 0, clock: IClock = REAL_CLOCK):
         self.temperature = temperature
         self.type = "ClassicStove"
+        self.clock = clock
 
     def warm_up(self, temperature: int) -> None:
-        time.sleep((temperature - self.temperature) / 10)
+        self.clock.sleep((temperature - self.temperature) / 10)
         print(f"Temperature warm up from {self.temperature}"
               f" to {temperature}")
         self.temperature = temperature
 
     def cool_down(self, temperature: int) -> None:
-        time.sleep((self.temperature - temperature)/5)
+        self.clock.sleep((self.temperature - temperature)/5)
         print(f"Temperature cool down from {self.temperature}"
               f" to {temperature}")
         self.temperature = temperature
 
     def cook_pizza(self, pizza: Pizza) -> None:
-        time.sleep(pizza.cook_time/10)
+        self.clock.sleep(pizza.cook_time/10)
         pizza.cook()
 
     def get_oven_type(self) -> str:
@@ -76,24 +100,25 @@ class ClassicOvenImplementor(IOvenImplementor):
 
 class ElectricalOvenImplementor(IOvenImplementor):
 
-    def __init__(self, temperature: int = 0):
+    def __init__(self, temperature: int = 0, clock: IClock = REAL_CLOCK):
         self.temperature = temperature
         self.type = "ElectricalStove"
+        self.clock = clock
 
     def warm_up(self, temperature: int) -> None:
-        time.sleep((temperature - self.temperature) / 30)
+        self.clock.sleep((temperature - self.temperature) / 30)
         print(f"Temperature warm up from {self.temperature}"
               f" to {temperature}")
         self.temperature = temperature
 
     def cool_down(self, temperature: int) -> None:
-        time.sleep((self.temperature - temperature) / 20)
+        self.clock.sleep((self.temperature - temperature) / 20)
         print(f"Temperature cool down from {self.temperature}"
               f" to {temperature}")
         self.temperature = temperature
 
     def cook_pizza(self, pizza: Pizza) -> None:
-        time.sleep(pizza.cook_time / 10)
+        self.clock.sleep(pizza.cook_time / 10)
         pizza.cook()
 
     def get_oven_type(self) -> str:
@@ -0,0 +1,178 @@
+"""
+Discrete-event simulation of a kitchen full of bridge_example ovens.
+
+The oven implementors take their time from a pluggable clock. With a virtual
+clock `sleep` only moves the oven's own time forward, so the unchanged Oven /
+implementor code runs instantly. The simulator keeps one queue of orders and
+the ovens ordered by the moment they become free: every order, in order of
+arrival, goes to the oven that is free first and starts when both the order
+and the oven are there. Each oven has its own virtual clock, set to the start
+of the order before the oven cooks it, and the time it shows afterwards is
+when the oven is free again.
+
+Times are in the units the implementors sleep in (seconds).
+"""
+
+import contextlib
+import heapq
+import random
+import statistics
+import time
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Sequence, Tuple
+
+from structural.bridge_example import ClassicOvenImplementor, ElectricalOvenImplementor, IClock, \
+    IOvenImplementor, Oven, Pizza
+
+
+class VirtualClock(IClock):
+
+    def __init__(self, start: float = 0.0):
+        self._now = start
+
+    def now(self) -> float:
+        return self._now
+
+    def sleep(self, seconds: float) -> None:
+        if seconds < 0:
+            raise ValueError("Cannot sleep back in time")
+        self._now += seconds
+
+    def advance_to(self, moment: float) -> None:
+        self._now = max(self._now, moment)
+
+
+class OvenReport(NamedTuple):
+    oven_type: str
+    orders: int
+    busy: float
+    utilization: float
+    mean_wait: float
+    max_wait: float
+
+
+class KitchenReport(NamedTuple):
+    duration: float
+    orders: int
+    mean_wait: float
+    p95_wait: float
+    max_wait: float
+    ovens: List[OvenReport]
+
+
+class _Discard:
+    """ Swallows what the ovens print, nobody reads thousands of ovens' logs """
+    def write(self, text: str) -> int:
+        return len(text)
+
+    def flush(self) -> None:
+        pass
+
+
+class KitchenSimulator:
+
+    def __init__(self, implementors: Sequence[Callable[..., IOvenImplementor]], echo: bool = False):
+        """
+        `implementors` are called with a `clock` keyword argument, one per
+        oven. With `echo` the ovens' messages are printed as usual.
+        """
+        if not implementors:
+            raise ValueError("A kitchen needs at least one oven")
+        self.clocks = [VirtualClock() for _ in implementors]
+        self.implementors = [make(clock=clock) for make, clock in zip(implementors, self.clocks)]
+        self.ovens = [Oven(implementor) for implementor in self.implementors]
+        self.echo = echo
+
+    def run(self, orders: Iterable[Tuple[float, Pizza]]) -> KitchenReport:
+        """
+        Cooks the orders, pairs of arrival time and pizza sorted by arrival,
+        and reports how busy the ovens were and how long orders waited.
+        """
+        count = len(self.ovens)
+        free: List[Tuple[float, int]] = [(clock.now(), i) for i, clock in enumerate(self.clocks)]
+        heapq.heapify(free)
+        busy = [0.0] * count
+        served = [0] * count
+        waited = [0.0] * count
+        longest = [0.0] * count
+        waits: List[float] = []
+        finished = 0.0
+
+        output = contextlib.nullcontext() if self.echo else contextlib.redirect_stdout(_Discard())
+        with output:
+            previous = float("-inf")
+            for arrival, pizza in orders:
+                if arrival < previous:
+                    raise ValueError("Orders must be sorted by arrival time")
+                previous = arrival
+                free_at, i = heapq.heappop(free)
+                clock = self.clocks[i]
+                start = max(arrival, free_at)
+                clock.advance_to(start)
+                self.ovens[i].cook_pizza(pizza)
+                done = clock.now()
+                heapq.heappush(free, (done, i))
+
+                wait = start - arrival
+                busy[i] += done - start
+                served[i] += 1
+                waited[i] += wait
+                longest[i] = max(longest[i], wait)
+                waits.append(wait)
+                finished = max(finished, done)
+
+        ovens = [
+            OvenReport(self.implementors[i].get_oven_type(), served[i], busy[i],
+                       busy[i] / finished if finished else 0.0,
+                       waited[i] / served[i] if served[i] else 0.0, longest[i])
+            for i in range(count)
+        ]
+        if not waits:
+            return KitchenReport(finished, 0, 0.0, 0.0, 0.0, ovens)
+        waits.sort()
+        return KitchenReport(finished, len(waits), statistics.fmean(waits),
+                             waits[min(len(waits) - 1, int(len(waits) * 0.95))], waits[-1], ovens)
+
+
+MENU = (("Margarita", 10, 220), ("Salami", 9, 180), ("Marinara", 8, 250), ("Quattro Formaggi", 12, 200))
+
+
+def poisson_orders(rate: float, duration: float, seed: int = 0) -> Iterator[Tuple[float, Pizza]]:
+    """
+    Orders arriving at random with `rate` orders per second on average.
+    """
+    rng = random.Random(seed)
+    moment = rng.expovariate(rate)
+    while moment < duration:
+        yield moment, Pizza(*rng.choice(MENU))
+        moment += rng.expovariate(rate)
+
+
+def _summary(report: KitchenReport) -> str:
+    by_type: Dict[str, List[OvenReport]] = {}
+    for oven in report.ovens:
+        by_type.setdefault(oven.oven_type, []).append(oven)
+    lines = [f"{report.orders} orders in {report.duration / 3600:.1f} h, waiting mean {report.mean_wait:.1f} s, "
+             f"p95 {report.p95_wait:.1f} s, max {report.max_wait:.1f} s"]
+    for oven_type, ovens in by_type.items():
+        lines.append(f"  {len(ovens)} x {oven_type}: utilization "
+                     f"{statistics.fmean(it.utilization for it in ovens):.0%}, "
+                     f"{statistics.fmean(it.orders for it in ovens):.0f} orders and "
+                     f"{statistics.fmean(it.mean_wait for it in ovens):.1f} s mean wait per oven")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    kitchen = KitchenSimulator([ClassicOvenImplementor, ElectricalOvenImplementor], echo=True)
+    report = kitchen.run([(0, Pizza("Margarita", 10, 220)), (0, Pizza("Salami", 9, 180)),
+                          (1, Pizza("Margarita", 9, 225))])
+    for i, oven in enumerate(report.ovens):
+        print(f"Oven {i}: {oven}")
+    print("===========================")
+
+    for ovens, rate, hours in ((100, 10, 8), (100, 30, 8), (100, 33, 2), (2000, 250, 1)):
+        kitchen = KitchenSimulator([ClassicOvenImplementor, ElectricalOvenImplementor] * (ovens // 2))
+        start = time.perf_counter()
+        report = kitchen.run(poisson_orders(rate, hours * 3600))
+        elapsed = time.perf_counter() - start
+        print(f"{ovens} ovens, {rate} orders/s for {hours} h, simulated in {elapsed:.1f} s:")
+        print(_summary(report))
@@ -0,0 +1,67 @@
+import pytest
+
+from structural.adapter import IOven, OriginalOven, OvenAdapter
+
+
+class UnversionedOven(IOven):
+    """
+    An adaptee that does not track its changes, get_version() returns None
+    """
+    def __init__(self, t: float):
+        self.t = t
+        self.reads = 0
+
+    def get_temperature(self) -> float:
+        self.reads += 1
+        return self.t
+
+    def set_temperature(self, t: float) -> None:
+        self.t = t
+
+
+@pytest.fixture
+def oven():
+    return OriginalOven(32)
+
+
+def test_direct_set_temperature_is_not_a_stale_read(oven):
+    adapter = OvenAdapter(oven)
+    assert adapter.get_celsius_temperature() == 0.0
+    oven.set_temperature(212)
+    assert adapter.get_celsius_temperature() == pytest.approx(100.0)
+
+
+def test_direct_assignment_is_not_a_stale_read(oven):
+    adapter = OvenAdapter(oven)
+    adapter.get_celsius_temperature()
+    oven.temperature = 392
+    assert adapter.get_celsius_temperature() == pytest.approx(200.0)
+
+
+def test_set_celsius_temperature_round_trip(oven):
+    adapter = OvenAdapter(oven)
+    adapter.set_celsius_temperature(180)
+    assert adapter.get_original_temperature() == pytest.approx(356.0)
+    assert adapter.get_celsius_temperature() == pytest.approx(180.0)
+    oven.set_temperature(32)
+    assert adapter.get_celsius_temperature() == pytest.approx(0.0)
+
+
+def test_cached_read_does_not_touch_the_oven(oven):
+    adapter = OvenAdapter(oven)
+    oven.set_temperature(212)
+    adapter.get_celsius_temperature()
+    oven._temperature = 32  # bypasses the version on purpose
+    assert adapter.get_celsius_temperature() == pytest.approx(100.0)
+
+
+def test_unversioned_oven_is_recomputed_on_every_read():
+    stove = UnversionedOven(212)
+    adapter = OvenAdapter(stove)
+    assert adapter.get_celsius_temperature() == pytest.approx(100.0)
+    stove.t = 392
+    assert adapter.get_celsius_temperature() == pytest.approx(200.0)
+    reads = stove.reads
+    adapter.get_celsius_temperature()
+    adapter.get_celsius_temperature()
+    assert stove.reads == reads + 2